@@ -5,18 +5,23 @@ Uses platform-appropriate storage when possible, falls back to a JSON file
 in the user's home directory.
 """
 
+import copy
 import json
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Configuration file name (hidden file in home directory)
 CONFIG_FILENAME = ".sightline.json"
 
+# Last configuration read from or written to disk, keyed by file path and
+# modification time, so unchanged files are not parsed again
+_config_cache: Optional[Tuple[Path, int, Dict[str, Any]]] = None
+
 
 def get_config_path() -> Path:
     """Get the path to the configuration file.
@@ -100,6 +105,7 @@ def load_config() -> Dict[str, Any]:
         Dictionary containing configuration. Returns default configuration
         if file doesn't exist or cannot be read.
     """
+    global _config_cache
     config_path = get_config_path()
 
     if not config_path.exists():
@@ -113,9 +119,14 @@ def load_config() -> Dict[str, Any]:
             return get_default_config()
 
     try:
+        mtime = config_path.stat().st_mtime_ns
+        if _config_cache and _config_cache[:2] == (config_path, mtime):
+            return copy.deepcopy(_config_cache[2])
+
         with open(config_path, "r", encoding="utf-8") as f:
             config: Dict[str, Any] = json.load(f)
         logger.info(f"Loaded configuration from: {config_path}")
+        _config_cache = (config_path, mtime, copy.deepcopy(config))
         return config
     except (json.JSONDecodeError, IOError, OSError) as e:
         logger.warning(f"Error loading config from {config_path}: {e}")
@@ -132,7 +143,9 @@ def save_config(config: Dict[str, Any]) -> bool:
     Returns:
         True if configuration was saved successfully, False otherwise.
     """
+    global _config_cache
     config_path = get_config_path()
+    _config_cache = None
 
     try:
         # Ensure parent directory exists
@@ -71,11 +71,16 @@ if getattr(sys, "frozen", False):
     # No patching needed if modules are properly included
 
 import argparse
+import copy
+import functools
 import logging
 import shutil
+import stat
 import subprocess
 import sys
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tkinter import messagebox
 from typing import Any, Dict, List, Optional, Tuple
@@ -107,7 +112,7 @@ except ImportError:
     sys.exit(1)
 
 from config_manager import get_default_config, load_config, save_config
-from views import FaceBlurView, HomeView, TranscriptionView
+from views import FaceBlurView, GenericBatchView, HomeView, TranscriptionView
 from views.base_view import BaseView
 
 # Version information
@@ -122,6 +127,9 @@ FILE_LIST_HEIGHT = 300
 MAX_FILENAME_DISPLAY_LENGTH = 35
 MAX_BATCH_SIZE = 8
 PROGRESS_CHECK_INTERVAL_MS = 50
+SHUTDOWN_POLL_INTERVAL_MS = 100
+SHUTDOWN_TIMEOUT_S = 5
+CONFIG_FLUSH_DELAY_MS = 1000
 
 # Supported file extensions
 SUPPORTED_EXTENSIONS = {
@@ -182,10 +190,12 @@ def parse_args():
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path: str) -> str:
     """Get the absolute path to a resource file.
 
-    Works both in development and when bundled with PyInstaller.
+    Works both in development and when bundled with PyInstaller. The bundle
+    location is fixed for the life of the process, so results are cached.
 
     Args:
         relative_path: Relative path to the resource file.
@@ -203,18 +213,44 @@ def get_resource_path(relative_path: str) -> str:
     return str(Path(base_path) / relative_path)
 
 
-# Set customtkinter appearance mode and color theme
-# Use Dark mode to match Sightline brand guidelines
-ctk.set_appearance_mode("Dark")
-# Load custom Sightline theme
-theme_path = get_resource_path("sightline_theme.json")
-if Path(theme_path).exists():
-    ctk.set_default_color_theme(theme_path)
-else:
-    logger.warning(
-        f"Sightline theme file not found at {theme_path}, using default theme"
-    )
-    ctk.set_default_color_theme("blue")
+def _existing_resource(relative_path: str) -> Optional[str]:
+    """Get the absolute path to a resource file if it exists.
+
+    Args:
+        relative_path: Relative path to the resource file.
+
+    Returns:
+        Absolute path to the resource file, or None if it is missing.
+    """
+    path = get_resource_path(relative_path)
+    return path if os.path.exists(path) else None
+
+
+# Application icons, resolved once: .icns on macOS, .ico elsewhere, plus a
+# PNG fallback
+_NATIVE_ICON_PATH = _existing_resource(
+    "icon.icns" if sys.platform == "darwin" else "icon.ico"
+)
+_PNG_ICON_PATH = _existing_resource("icon.png")
+
+
+def apply_theme():
+    """Set the customtkinter appearance mode and color theme.
+
+    Called from main() once the command line is parsed, so `--help` and
+    `--version` exit without loading the theme file.
+    """
+    # Use Dark mode to match Sightline brand guidelines
+    ctk.set_appearance_mode("Dark")
+    # Load custom Sightline theme
+    theme_path = get_resource_path("sightline_theme.json")
+    if Path(theme_path).exists():
+        ctk.set_default_color_theme(theme_path)
+    else:
+        logger.warning(
+            f"Sightline theme file not found at {theme_path}, using default theme"
+        )
+        ctk.set_default_color_theme("blue")
 
 
 def build_deface_args(config: Dict[str, Any]) -> List[str]:
@@ -259,7 +295,38 @@ def build_deface_args(config: Dict[str, Any]) -> List[str]:
     return args
 
 
+# Resolved deface command prefix and the PATH it was resolved with; filled
+# on the first successful lookup
+_DEFACE_CMD_CACHE: Optional[Tuple[str, List[str]]] = None
+
+
+def _invalidate_deface_cmd_cache() -> None:
+    """Forget the cached deface command so the next lookup probes again."""
+    global _DEFACE_CMD_CACHE
+    _DEFACE_CMD_CACHE = None
+
+
 def _find_deface_command() -> List[str]:
+    """Locate the `deface` CLI command, reusing the result of earlier lookups.
+
+    The cached command is only reused while PATH is unchanged, so a PATH
+    edited during the session is searched again.
+
+    Returns:
+        A new list representing the command prefix to invoke `deface`; callers
+        may extend it freely.
+
+    Raises:
+        FileNotFoundError: If no suitable `deface` executable can be found.
+    """
+    global _DEFACE_CMD_CACHE
+    path_env = os.environ.get("PATH", "")
+    if _DEFACE_CMD_CACHE is None or _DEFACE_CMD_CACHE[0] != path_env:
+        _DEFACE_CMD_CACHE = (path_env, _resolve_deface_command())
+    return list(_DEFACE_CMD_CACHE[1])
+
+
+def _resolve_deface_command() -> List[str]:
     """Locate the `deface` CLI command in both dev and bundled environments.
 
     Resolution order:
@@ -307,7 +374,7 @@ def _find_deface_command() -> List[str]:
 
         for candidate in candidates:
             if candidate.exists() and os.access(candidate, os.X_OK):
-                logger.info(f"Using bundled deface binary: {candidate}")
+                logger.info("Using bundled deface binary: %s", candidate)
                 return [str(candidate)]
 
     # 2. Fallback to a `deface` found on PATH, but avoid resolving to
@@ -317,7 +384,7 @@ def _find_deface_command() -> List[str]:
     if path_cmd:
         try:
             if Path(path_cmd).resolve() != exe_path:
-                logger.info(f"Using deface from PATH: {path_cmd}")
+                logger.info("Using deface from PATH: %s", path_cmd)
                 return [path_cmd]
             else:
                 logger.warning(
@@ -326,7 +393,7 @@ def _find_deface_command() -> List[str]:
                 )
         except Exception:
             # If anything goes wrong with samefile/resolve, still prefer PATH
-            logger.info(f"Using deface from PATH (fallback): {path_cmd}")
+            logger.info("Using deface from PATH (fallback): %s", path_cmd)
             return [path_cmd]
 
     # Nothing found – raise a helpful error
@@ -338,7 +405,10 @@ def _find_deface_command() -> List[str]:
 
 
 def run_deface(
-    input_path: str, output_path: str, config: Optional[Dict[str, Any]] = None
+    input_path: str,
+    output_path: str,
+    config: Optional[Dict[str, Any]] = None,
+    extra_args: Optional[List[str]] = None,
 ) -> subprocess.Popen:
     """Run the deface command as a subprocess.
 
@@ -346,6 +416,8 @@ def run_deface(
         input_path: Path to the input image or video file.
         output_path: Path where the output file should be saved.
         config: Optional dictionary containing deface configuration options.
+        extra_args: Optional arguments already built with build_deface_args;
+            when given, config is ignored. Lets a batch build them once.
 
     Returns:
         A subprocess.Popen object representing the running process.
@@ -357,26 +429,39 @@ def run_deface(
     cmd = _find_deface_command()
     cmd.extend([input_path, "--output", output_path])
 
-    if config:
+    if extra_args is not None:
+        cmd.extend(extra_args)
+    elif config:
         cmd.extend(build_deface_args(config))
 
-    logger.info(f"Running deface command: {' '.join(cmd)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Running deface command: %s", " ".join(cmd))
     try:
         # On Windows, use CREATE_NO_WINDOW to prevent a console window from appearing
         creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        # Pipes are unbuffered binary; the view's reader decodes complete
+        # lines itself instead of going through a TextIOWrapper. deface never
+        # reads input, so stdin is not inherited from the GUI process.
+        # On POSIX, run deface in its own session so stopping it can signal
+        # the whole process group, including any workers it spawned. The
+        # command is an argv list with a resolved executable and is never
+        # run through a shell.
         proc = subprocess.Popen(
             cmd,
+            shell=False,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
+            bufsize=0,
             creationflags=creationflags,
+            start_new_session=sys.platform != "win32",
         )
         return proc
     except FileNotFoundError:
         logger.error("deface command not found. Please ensure deface is installed.")
         raise
     except OSError as e:
-        logger.error(f"Failed to start deface process: {e}")
+        logger.error("Failed to start deface process: %s", e)
         raise
 
 
@@ -422,11 +507,13 @@ def get_default_log_path() -> Optional[Path]:
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def get_desktop_path() -> str:
     """Get the user's Desktop folder path.
 
     Works on Windows, macOS, and Linux. Falls back to home directory
-    if Desktop folder doesn't exist.
+    if Desktop folder doesn't exist. The result is cached, so the Desktop
+    folder is only checked on the first call.
 
     Returns:
         Path to the Desktop folder, or home directory as fallback.
@@ -456,18 +543,21 @@ def validate_paths(input_path: str, output_dir: str) -> Tuple[bool, Optional[str
     if not output_dir:
         return False, "Please select an output directory."
 
-    input_file = Path(input_path)
-    if not input_file.exists():
+    # One stat() per path answers both "exists" and "what kind"
+    try:
+        input_mode = os.stat(input_path).st_mode
+    except (OSError, ValueError):
         return False, f"Input file does not exist: {input_path}"
 
-    if not input_file.is_file():
+    if not stat.S_ISREG(input_mode):
         return False, f"Input path is not a file: {input_path}"
 
-    output_path = Path(output_dir)
-    if not output_path.exists():
+    try:
+        output_mode = os.stat(output_dir).st_mode
+    except (OSError, ValueError):
         return False, f"Output directory does not exist: {output_dir}"
 
-    if not output_path.is_dir():
+    if not stat.S_ISDIR(output_mode):
         return False, f"Output path is not a directory: {output_dir}"
 
     return True, None
@@ -504,41 +594,19 @@ class SightlineApp(ctk.CTk, TkinterDnD.Tk):
 
         self.icon_image = None
         try:
-            # Platform-specific icon loading
-            if sys.platform == "darwin":
-                # macOS: prefer .icns, fall back to .png
-                icon_icns_path = get_resource_path("icon.icns")
-                icon_png_path = get_resource_path("icon.png")
-
-                if Path(icon_icns_path).exists():
-                    try:
-                        self.iconbitmap(icon_icns_path)
-                    except Exception:
-                        # Fall back to PNG if ICNS fails
-                        if Path(icon_png_path).exists():
-                            self.icon_image = tk.PhotoImage(file=icon_png_path)
-                            self.iconphoto(False, self.icon_image)
-                elif Path(icon_png_path).exists():
-                    self.icon_image = tk.PhotoImage(file=icon_png_path)
-                    self.iconphoto(False, self.icon_image)
-            else:
-                # Windows/Linux: try .ico first, then .png
-                icon_ico_path = get_resource_path("icon.ico")
-                icon_png_path = get_resource_path("icon.png")
-
-                if Path(icon_ico_path).exists():
-                    # Use iconbitmap for .ico files (works on Windows)
-                    try:
-                        self.iconbitmap(icon_ico_path)
-                    except Exception:
-                        # If iconbitmap fails, fall back to PNG
-                        if Path(icon_png_path).exists():
-                            self.icon_image = tk.PhotoImage(file=icon_png_path)
-                            self.iconphoto(False, self.icon_image)
-                elif Path(icon_png_path).exists():
-                    # Use iconphoto for PNG files (works cross-platform)
-                    self.icon_image = tk.PhotoImage(file=icon_png_path)
-                    self.iconphoto(False, self.icon_image)
+            # Prefer the platform's native icon format, fall back to PNG
+            if _NATIVE_ICON_PATH:
+                try:
+                    self.iconbitmap(_NATIVE_ICON_PATH)
+                except Exception:
+                    # Fall back to PNG if the native icon fails
+                    if _PNG_ICON_PATH:
+                        self.icon_image = tk.PhotoImage(file=_PNG_ICON_PATH)
+                        self.iconphoto(False, self.icon_image)
+            elif _PNG_ICON_PATH:
+                # Use iconphoto for PNG files (works cross-platform)
+                self.icon_image = tk.PhotoImage(file=_PNG_ICON_PATH)
+                self.iconphoto(False, self.icon_image)
         except Exception as e:
             logger.warning(f"Could not load application icon: {e}")
 
@@ -553,6 +621,15 @@ class SightlineApp(ctk.CTk, TkinterDnD.Tk):
         # Store full config for access to other settings like hugging_face_token
         self.full_config = saved_config
 
+        # Config changes are written to disk after a short delay, so a burst
+        # of changes results in a single write. Writes run on a single worker
+        # thread, in order, so a slow disk never stalls the UI.
+        self._config_dirty = False
+        self._config_flush_pending = False
+        self._config_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="config-writer"
+        )
+
         # View management
         self.current_view: Optional[BaseView] = None
         self.views: Dict[str, BaseView] = {}
@@ -605,8 +682,23 @@ class SightlineApp(ctk.CTk, TkinterDnD.Tk):
         """
         return get_desktop_path()
 
+    def build_deface_args(self, config: Dict[str, Any]) -> List[str]:
+        """Build deface command-line arguments from a configuration dictionary.
+
+        Args:
+            config: Dictionary containing deface configuration options.
+
+        Returns:
+            List of command-line argument strings.
+        """
+        return build_deface_args(config)
+
     def run_deface(
-        self, input_path: str, output_path: str, config: Optional[Dict[str, Any]] = None
+        self,
+        input_path: str,
+        output_path: str,
+        config: Optional[Dict[str, Any]] = None,
+        extra_args: Optional[List[str]] = None,
     ) -> subprocess.Popen:
         """Run the deface command as a subprocess.
 
@@ -614,6 +706,7 @@ class SightlineApp(ctk.CTk, TkinterDnD.Tk):
             input_path: Path to the input image or video file.
             output_path: Path where the output file should be saved.
             config: Optional dictionary containing deface configuration options.
+            extra_args: Optional prebuilt arguments that replace config.
 
         Returns:
             A subprocess.Popen object representing the running process.
@@ -622,29 +715,53 @@ class SightlineApp(ctk.CTk, TkinterDnD.Tk):
             FileNotFoundError: If the deface command cannot be found.
             OSError: If the subprocess cannot be started.
         """
-        return run_deface(input_path, output_path, config)
+        return run_deface(input_path, output_path, config, extra_args)
 
     def _save_config(self):
-        """Save current configuration to disk."""
+        """Record a configuration change and schedule writing it to disk."""
         # Get output directory from current view if it has one
-        output_dir = None
         if self.current_view and hasattr(self.current_view, "output_entry"):
             output_dir = self.current_view.output_entry.get().strip() or None
+            if output_dir:
+                self.saved_output_directory = output_dir
+
+        self.full_config = self._build_config()
+        self._config_dirty = True
+        if not self._config_flush_pending:
+            self._config_flush_pending = True
+            self.after(CONFIG_FLUSH_DELAY_MS, self._flush_config)
+
+    def _build_config(self) -> Dict[str, Any]:
+        """Build the configuration dictionary that is persisted to disk.
 
+        Returns:
+            Dictionary containing the full application configuration.
+        """
         default_config = get_default_config()
-        config_to_save = {
+        return {
             "deface_config": self.config,
-            "output_directory": output_dir or self.saved_output_directory,
+            "output_directory": self.saved_output_directory,
             "hugging_face_token": self.full_config.get("hugging_face_token", ""),
             "face_smudge_config": self.full_config.get(
                 "face_smudge_config", default_config.get("face_smudge_config", {})
             ),
         }
-        save_config(config_to_save)
-        if output_dir:
-            self.saved_output_directory = output_dir
-        # Update full_config
-        self.full_config = config_to_save
+
+    def _flush_config(self, wait: bool = False):
+        """Write the configuration to disk if it changed since the last write.
+
+        Args:
+            wait: Whether to block until every queued write has finished and
+                shut the writer down. Used when the application exits.
+        """
+        self._config_flush_pending = False
+        if self._config_dirty:
+            self._config_dirty = False
+            # Snapshot the config, since the UI may change it during the write
+            config = copy.deepcopy(self._build_config())
+            self._config_writer.submit(save_config, config)
+        if wait:
+            self._config_writer.shutdown(wait=True)
 
     def _open_face_smudge(self):
         """Open the Face Smudge window."""
@@ -670,19 +787,60 @@ class SightlineApp(ctk.CTk, TkinterDnD.Tk):
     def _on_closing(self):
         """Handle window closing event."""
         # Check if current view has active processing
-        if self.current_view and hasattr(self.current_view, "is_processing"):
-            if self.current_view.is_processing:
-                if messagebox.askokcancel(
-                    "Quit",
-                    "Processing is running. Do you want to terminate all processes and quit?",
-                ):
-                    logger.info("Terminating running processes...")
-                    # Cleanup will be handled by view's cleanup method
-                    if self.current_view:
-                        self.current_view.cleanup()
-                    self.destroy()
+        view = self.current_view
+        if isinstance(view, GenericBatchView) and view.is_processing:
+            if messagebox.askokcancel(
+                "Quit",
+                "Processing is running. Do you want to terminate all processes and quit?",
+            ):
+                logger.info("Terminating running processes...")
+                # Ask processes to stop, then watch for their exit from the
+                # event loop so the window stays responsive meanwhile. The
+                # view and its signalled processes are passed along, since
+                # the batch forgets them and the user may switch views.
+                terminated = view.request_stop()
+                self.after(
+                    SHUTDOWN_POLL_INTERVAL_MS,
+                    self._poll_shutdown,
+                    view,
+                    terminated,
+                    time.monotonic(),
+                )
+            return
+
+        self._flush_config(wait=True)
+        self.destroy()
+
+    def _poll_shutdown(
+        self,
+        view: GenericBatchView,
+        processes: List[Tuple[str, subprocess.Popen]],
+        start: float,
+    ):
+        """Destroy the window once the stopped processes have exited.
+
+        Processes still running after SHUTDOWN_TIMEOUT_S are killed.
+
+        Args:
+            view: The view whose processing was stopped.
+            processes: (file_path, process) tuples that were signalled to stop.
+            start: time.monotonic() value when shutdown was requested.
+        """
+        if any(proc.poll() is None for _, proc in processes):
+            if time.monotonic() - start < SHUTDOWN_TIMEOUT_S:
+                self.after(
+                    SHUTDOWN_POLL_INTERVAL_MS,
+                    self._poll_shutdown,
+                    view,
+                    processes,
+                    start,
+                )
                 return
+            view.kill_processes(processes)
 
+        # Cleanup will be handled by view's cleanup method
+        view.cleanup()
+        self._flush_config(wait=True)
         self.destroy()
 
     def _bring_to_front(self):
@@ -769,6 +927,13 @@ def main():
     if log_file_path:
         logger.info(f"Logging to file: {log_file_path}")
 
+    # Free-threaded (3.13t) builds can run the stream reader truly in parallel
+    # with the Tk mainloop; record which mode we are in for bug reports
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    gil_enabled = is_gil_enabled() if is_gil_enabled else True
+    logger.info("Python %s, GIL enabled: %s", sys.version.split()[0], gil_enabled)
+
+    apply_theme()
     app = SightlineApp()
     try:
         app.mainloop()
@@ -781,6 +946,9 @@ def main():
         logger.exception("Unexpected error in main loop")
         messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
     finally:
+        # Write a configuration change still waiting for its delayed flush;
+        # an interrupted or crashed main loop never reaches _on_closing
+        app._flush_config(wait=True)
         logger.info("Application closed")
 
 
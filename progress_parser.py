@@ -1,10 +1,18 @@
 """Progress parser for tqdm-style progress output."""
 import logging
 import re
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Regex pattern to match tqdm progress bar format
+# Format: percentage%|bar|current/total [elapsed<remaining, rate]
+# The bar never contains "|", so it is matched with a negated class rather
+# than a lazy ".*?" that would backtrack over the rest of the line.
+_PROGRESS_RE = re.compile(
+    r'(\d+)%\s*\|[^|]*\|\s*(\d+)/(\d+)\s*\[(\d+):(\d+)<(\d+):(\d+),\s*([\d.]+)(\w+)/s\]'
+)
+
 
 class ProgressParser:
     """Parse tqdm-style progress output and extract progress information.
@@ -12,11 +20,9 @@ class ProgressParser:
     Parses lines like: "33%|███▎      | 415/1275 [00:13<00:27, 31.12it/s]"
     """
     
-    # Regex pattern to match tqdm progress bar format
-    # Format: percentage%|bar|current/total [elapsed<remaining, rate]
-    PROGRESS_PATTERN = re.compile(
-        r'(\d+)%\s*\|.*?\|\s*(\d+)/(\d+)\s*\[(\d+):(\d+)<(\d+):(\d+),\s*([\d.]+)(\w+)/s\]'
-    )
+    PROGRESS_PATTERN = _PROGRESS_RE
+    # Substring every tqdm progress line contains
+    LINE_MARKER = "%|"
     
     def __init__(self):
         self.percentage = 0.0
@@ -27,6 +33,12 @@ class ProgressParser:
         self.rate = 0.0
         self.rate_unit = ""
         self.is_valid = False
+        
+        # Last (inputs, text) for each formatter; consecutive tqdm lines often
+        # repeat the same values, so the strings can be reused
+        self._eta_cache: Tuple[Optional[int], str] = (None, "")
+        self._elapsed_cache: Tuple[Optional[int], str] = (None, "")
+        self._rate_cache: Tuple[Optional[Tuple[float, str]], str] = (None, "")
     
     def parse(self, line: str) -> bool:
         """Parse a progress line and extract information.
@@ -37,32 +49,65 @@ class ProgressParser:
         Returns:
             True if progress information was found and parsed, False otherwise.
         """
-        match = self.PROGRESS_PATTERN.search(line)
+        # Cheap rejection for the many lines that are not progress output
+        idx = line.find(self.LINE_MARKER)
+        if idx < 0:
+            self.is_valid = False
+            return False
+        
+        # tqdm prints the percentage right before "%|", so anchor the pattern
+        # at that digit run instead of searching the whole line
+        start = len(line[:idx].rstrip("0123456789"))
+        match = _PROGRESS_RE.match(line, start)
         if not match:
             self.is_valid = False
             return False
         
         try:
-            self.percentage = float(match.group(1))
-            self.current = int(match.group(2))
-            self.total = int(match.group(3))
-            elapsed_minutes = int(match.group(4))
-            elapsed_secs = int(match.group(5))
-            remaining_minutes = int(match.group(6))
-            remaining_secs = int(match.group(7))
-            self.rate = float(match.group(8))
-            self.rate_unit = match.group(9)
+            (
+                percentage,
+                current,
+                total,
+                elapsed_minutes,
+                elapsed_secs,
+                remaining_minutes,
+                remaining_secs,
+                rate,
+                rate_unit,
+            ) = match.groups()
+            self.percentage = float(percentage)
+            self.current = int(current)
+            self.total = int(total)
+            self.rate = float(rate)
+            self.rate_unit = rate_unit
             
-            self.elapsed_seconds = elapsed_minutes * 60 + elapsed_secs
-            self.remaining_seconds = remaining_minutes * 60 + remaining_secs
+            self.elapsed_seconds = int(elapsed_minutes) * 60 + int(elapsed_secs)
+            self.remaining_seconds = int(remaining_minutes) * 60 + int(remaining_secs)
             
             self.is_valid = True
             return True
         except (ValueError, IndexError) as e:
-            logger.debug(f"Error parsing progress line: {e}")
+            logger.debug("Error parsing progress line: %s", e)
             self.is_valid = False
             return False
     
+    def feed(self, lines: Sequence[str]) -> bool:
+        """Parse the newest progress line from a batch of output lines.
+
+        Only the latest progress matters for display, so lines are tried from
+        the end and older progress lines in the batch are never parsed.
+
+        Args:
+            lines: Lines of output, oldest first.
+
+        Returns:
+            True if a progress line was found and parsed, False otherwise.
+        """
+        for line in reversed(lines):
+            if self.parse(line):
+                return True
+        return False
+    
     def format_eta(self) -> str:
         """Format estimated time remaining as a human-readable string.
         
@@ -72,16 +117,19 @@ class ProgressParser:
         if not self.is_valid or self.remaining_seconds <= 0:
             return "--:--"
         
+        key, text = self._eta_cache
+        if key == self.remaining_seconds:
+            return text
+        
         if self.remaining_seconds < 3600:
             # Less than an hour: show as MM:SS
-            minutes = self.remaining_seconds // 60
-            seconds = self.remaining_seconds % 60
-            return f"{minutes:02d}:{seconds:02d}"
+            text = "%02d:%02d" % divmod(self.remaining_seconds, 60)
         else:
             # More than an hour: show as Xh Ym
-            hours = self.remaining_seconds // 3600
-            minutes = (self.remaining_seconds % 3600) // 60
-            return f"{hours}h {minutes}m"
+            hours, rest = divmod(self.remaining_seconds, 3600)
+            text = "%dh %dm" % (hours, rest // 60)
+        self._eta_cache = (self.remaining_seconds, text)
+        return text
     
     def format_elapsed(self) -> str:
         """Format elapsed time as a human-readable string.
@@ -92,9 +140,13 @@ class ProgressParser:
         if not self.is_valid:
             return "00:00"
         
-        minutes = self.elapsed_seconds // 60
-        seconds = self.elapsed_seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
+        key, text = self._elapsed_cache
+        if key == self.elapsed_seconds:
+            return text
+        
+        text = "%02d:%02d" % divmod(self.elapsed_seconds, 60)
+        self._elapsed_cache = (self.elapsed_seconds, text)
+        return text
     
     def format_rate(self) -> str:
         """Format processing rate as a human-readable string.
@@ -105,7 +157,14 @@ class ProgressParser:
         if not self.is_valid or self.rate <= 0:
             return "0 it/s"
         
-        return f"{self.rate:.2f} {self.rate_unit}/s"
+        key = (self.rate, self.rate_unit)
+        cached_key, text = self._rate_cache
+        if cached_key == key:
+            return text
+        
+        text = "%.2f %s/s" % key
+        self._rate_cache = (key, text)
+        return text
     
     def get_progress_fraction(self) -> float:
         """Get progress as a fraction between 0.0 and 1.0.
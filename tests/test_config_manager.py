@@ -0,0 +1,37 @@
+"""Unit tests for config_manager.py."""
+
+import json
+from unittest.mock import patch
+
+import config_manager
+
+
+class TestConfigCache:
+    """Tests for the load_config cache."""
+
+    def test_load_config_reuses_unchanged_file(self, tmp_path):
+        """Test that an unchanged file is parsed once and copies are returned."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"deface_config": {"thresh": 0.4}}))
+
+        with patch.object(config_manager, "get_config_path", return_value=config_path):
+            with patch.object(
+                config_manager.json, "load", wraps=config_manager.json.load
+            ) as mock_load:
+                first = config_manager.load_config()
+                first["deface_config"]["thresh"] = 0.9
+                second = config_manager.load_config()
+
+        assert mock_load.call_count == 1
+        assert second["deface_config"]["thresh"] == 0.4
+
+    def test_save_config_invalidates_cache(self, tmp_path):
+        """Test that a saved configuration is returned by the next load."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"hugging_face_token": "old"}))
+
+        with patch.object(config_manager, "get_config_path", return_value=config_path):
+            config_manager.load_config()
+            config_manager.save_config({"hugging_face_token": "new"})
+
+            assert config_manager.load_config() == {"hugging_face_token": "new"}
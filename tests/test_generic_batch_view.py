@@ -0,0 +1,199 @@
+"""Unit tests for the helper functions in views/generic_batch_view.py."""
+
+import os
+import queue
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from views import generic_batch_view
+from views.generic_batch_view import (
+    MAX_BATCH_SIZE,
+    GenericBatchView,
+    _path_kinds,
+    _pop_lines,
+    _worker_count,
+)
+
+MARKER = b"%|"
+
+
+class TestPopLines:
+    """Tests for _pop_lines."""
+
+    def test_splits_on_every_line_break(self):
+        """Test that LF, CRLF and bare CR all end a line."""
+        buf = bytearray(b"10%|a\n20%|b\r\n30%|c\r")
+
+        assert _pop_lines(buf, MARKER) == ["10%|a\n", "20%|b\n", "30%|c\n"]
+        assert buf == bytearray()
+
+    def test_keeps_trailing_partial_line(self):
+        """Test that an unterminated line stays in the buffer for the next read."""
+        buf = bytearray(b"10%|a\n20%|b")
+
+        assert _pop_lines(buf, MARKER) == ["10%|a\n"]
+        assert buf == bytearray(b"20%|b")
+
+        buf += b"c\n"
+        assert _pop_lines(buf, MARKER) == ["20%|bc\n"]
+
+    def test_without_line_break_returns_nothing(self):
+        """Test that a buffer without any line break is left untouched."""
+        buf = bytearray(b"10%|a")
+
+        assert _pop_lines(buf, MARKER) == []
+        assert buf == bytearray(b"10%|a")
+
+    def test_crlf_split_across_reads(self):
+        """Test that a CRLF split between two reads yields no extra line."""
+        buf = bytearray(b"Error: one\r")
+        assert _pop_lines(buf, MARKER) == ["Error: one\n"]
+
+        buf += b"\nError: two\n"
+        assert _pop_lines(buf, MARKER) == ["Error: two\n"]
+
+    def test_drops_irrelevant_lines(self):
+        """Test that only progress and error lines are kept."""
+        buf = bytearray(b"loading model\n50%|#| 1/2\nRuntimeError: boom\n\n")
+
+        assert _pop_lines(buf, MARKER) == ["50%|#| 1/2\n", "RuntimeError: boom\n"]
+
+    def test_without_marker_keeps_every_line(self):
+        """Test that a None marker passes all non-empty lines through."""
+        buf = bytearray(b"frame 1 of 2\n\nframe 2 of 2\n")
+
+        assert _pop_lines(buf, None) == ["frame 1 of 2\n", "frame 2 of 2\n"]
+
+    def test_decodes_invalid_utf8_with_replacement(self):
+        """Test that undecodable bytes do not raise."""
+        buf = bytearray(b"error \xff\n")
+
+        assert _pop_lines(buf, MARKER) == ["error �\n"]
+
+
+class TestPathKinds:
+    """Tests for _path_kinds."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Create a file, a directory with a media extension and a missing path."""
+        (tmp_path / "clip.mp4").write_bytes(b"")
+        (tmp_path / "folder.mp4").mkdir()
+        return {
+            "file": str(tmp_path / "clip.mp4"),
+            "dir": str(tmp_path / "folder.mp4"),
+            "missing": str(tmp_path / "missing.mp4"),
+        }
+
+    def test_classifies_with_stat(self, tree, monkeypatch):
+        """Test the per-path stat fallback used for small groups."""
+        monkeypatch.setattr(generic_batch_view, "SCANDIR_GROUP_THRESHOLD", 100)
+
+        kinds = _path_kinds(list(tree.values()))
+
+        assert kinds == {
+            tree["file"]: "file",
+            tree["dir"]: "dir",
+            tree["missing"]: None,
+        }
+
+    def test_classifies_with_scandir(self, tree, monkeypatch):
+        """Test that a large group is answered from one directory scan."""
+        monkeypatch.setattr(generic_batch_view, "SCANDIR_GROUP_THRESHOLD", 0)
+        stat_calls = []
+        real_stat = os.stat
+
+        def counting_stat(path, *args, **kwargs):
+            stat_calls.append(path)
+            return real_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(os, "stat", counting_stat)
+
+        kinds = _path_kinds(list(tree.values()))
+
+        assert kinds == {
+            tree["file"]: "file",
+            tree["dir"]: "dir",
+            tree["missing"]: None,
+        }
+        # Only the path missing from the listing needs its own stat
+        assert stat_calls == [tree["missing"]]
+
+    def test_unreadable_parent_falls_back_to_stat(self, tmp_path, monkeypatch):
+        """Test that a failing directory scan still classifies every path."""
+        monkeypatch.setattr(generic_batch_view, "SCANDIR_GROUP_THRESHOLD", 0)
+        (tmp_path / "clip.mp4").write_bytes(b"")
+
+        def failing_scandir(path):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+
+        assert _path_kinds([str(tmp_path / "clip.mp4")]) == {
+            str(tmp_path / "clip.mp4"): "file"
+        }
+
+
+class TestWorkerCount:
+    """Tests for _worker_count."""
+
+    @pytest.mark.parametrize(
+        "batch_size, expected",
+        [
+            (1, 1),
+            (4, 4),
+            ("3", 3),
+            (0, 1),
+            (-2, 1),
+            (MAX_BATCH_SIZE + 10, MAX_BATCH_SIZE),
+            (None, 1),
+            ("many", 1),
+        ],
+    )
+    def test_clamps_configured_batch_size(self, batch_size, expected):
+        """Test that hand-edited batch sizes stay within 1..MAX_BATCH_SIZE."""
+        assert _worker_count(batch_size) == expected
+
+
+class TestBatchWorker:
+    """Tests for GenericBatchView._batch_worker."""
+
+    def _run_worker(self, paths, process_file, stop):
+        """Run one worker over the given paths on the calling thread."""
+        view = SimpleNamespace(
+            _state_lock=threading.Lock(), active={}, _process_file=process_file
+        )
+        work: queue.SimpleQueue = queue.SimpleQueue()
+        for path in paths:
+            work.put({"path": path})
+
+        GenericBatchView._batch_worker(view, work, stop)
+
+        assert view.active == {}
+
+    def test_processes_every_file(self):
+        """Test that a worker drains the batch queue."""
+        processed = []
+
+        self._run_worker(
+            ["a", "b", "c"],
+            lambda info: processed.append(info["path"]),
+            threading.Event(),
+        )
+
+        assert processed == ["a", "b", "c"]
+
+    def test_stopped_worker_takes_no_more_files(self):
+        """Test that a worker stopped mid-file leaves the rest of its batch."""
+        stop = threading.Event()
+        processed = []
+
+        def process_file(info):
+            processed.append(info["path"])
+            stop.set()
+
+        self._run_worker(["a", "b", "c"], process_file, stop)
+
+        assert processed == ["a"]
@@ -1,6 +1,8 @@
 """Unit tests for main.py."""
 
 import os
+import subprocess
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -51,6 +53,100 @@ class TestRunDeface:
         assert "--output" in call_args
         assert output_path in call_args
 
+    def test_run_deface_with_prebuilt_args(self, mock_subprocess):
+        """Test that prebuilt arguments are passed through unchanged."""
+        mock_popen, mock_proc = mock_subprocess
+        extra_args = main.build_deface_args({"thresh": 0.5})
+
+        main.run_deface(
+            "/test/input.mp4",
+            "/test/output.mp4",
+            {"thresh": 0.9},
+            extra_args=extra_args,
+        )
+
+        call_args = mock_popen.call_args[0][0]
+        assert call_args[-len(extra_args) :] == extra_args
+        assert "0.9" not in call_args
+
+    def test_run_deface_uses_binary_pipes(self, mock_subprocess):
+        """Test that run_deface opens unbuffered binary pipes."""
+        mock_popen, mock_proc = mock_subprocess
+
+        main.run_deface("/test/input.mp4", "/test/output.mp4")
+
+        kwargs = mock_popen.call_args[1]
+        assert kwargs["bufsize"] == 0
+        assert not kwargs.get("text", False)
+        assert not kwargs.get("universal_newlines", False)
+        assert kwargs["stdin"] == subprocess.DEVNULL
+
+    def test_run_deface_does_not_use_shell(self, mock_subprocess):
+        """Test that deface is launched from an argv list without a shell."""
+        mock_popen, mock_proc = mock_subprocess
+
+        main.run_deface("/test/input file.mp4", "/test/output.mp4")
+
+        assert mock_popen.call_args[1]["shell"] is False
+        call_args = mock_popen.call_args[0][0]
+        assert isinstance(call_args, list)
+        assert "/test/input file.mp4" in call_args
+
+    def test_run_deface_starts_new_session_on_posix(self, mock_subprocess, monkeypatch):
+        """Test that deface gets its own process group outside Windows."""
+        mock_popen, mock_proc = mock_subprocess
+        monkeypatch.setattr(main.sys, "platform", "linux")
+
+        main.run_deface("/test/input.mp4", "/test/output.mp4")
+
+        assert mock_popen.call_args[1]["start_new_session"] is True
+        # Descriptors opened by C libraries may be inheritable, so the
+        # default close_fds sweep must stay on
+        assert mock_popen.call_args[1].get("close_fds", True) is True
+
+
+class TestFindDefaceCommand:
+    """Tests for the cached deface command lookup."""
+
+    def test_find_deface_command_is_cached(self, monkeypatch):
+        """Test that the lookup runs once and callers get independent copies."""
+        main._invalidate_deface_cmd_cache()
+        mock_resolve = MagicMock(return_value=["/usr/bin/deface"])
+        monkeypatch.setattr(main, "_resolve_deface_command", mock_resolve)
+
+        first = main._find_deface_command()
+        first.append("--extra")
+        second = main._find_deface_command()
+
+        assert second == ["/usr/bin/deface"]
+        mock_resolve.assert_called_once()
+        main._invalidate_deface_cmd_cache()
+
+    def test_path_change_invalidates_cache(self, monkeypatch):
+        """Test that a changed PATH triggers a new lookup."""
+        main._invalidate_deface_cmd_cache()
+        mock_resolve = MagicMock(side_effect=[["/a/deface"], ["/b/deface"]])
+        monkeypatch.setattr(main, "_resolve_deface_command", mock_resolve)
+        monkeypatch.setenv("PATH", "/a")
+
+        assert main._find_deface_command() == ["/a/deface"]
+        assert main._find_deface_command() == ["/a/deface"]
+        monkeypatch.setenv("PATH", "/b")
+        assert main._find_deface_command() == ["/b/deface"]
+        main._invalidate_deface_cmd_cache()
+
+    def test_failed_lookup_is_not_cached(self, monkeypatch):
+        """Test that a missing deface is looked up again on the next call."""
+        main._invalidate_deface_cmd_cache()
+        mock_resolve = MagicMock(side_effect=[FileNotFoundError, ["/opt/deface"]])
+        monkeypatch.setattr(main, "_resolve_deface_command", mock_resolve)
+
+        with pytest.raises(FileNotFoundError):
+            main._find_deface_command()
+
+        assert main._find_deface_command() == ["/opt/deface"]
+        main._invalidate_deface_cmd_cache()
+
 
 class TestGUILogic:
     """Tests for GUI logic and event handling."""
@@ -74,6 +170,26 @@ class TestGUILogic:
         assert not is_valid
         assert "output" in error_msg.lower()
 
+    def test_file_path_validation_checks_kinds(
+        self, sample_input_file, sample_output_dir
+    ):
+        """Test that paths must exist and be a file and a directory."""
+        from main import validate_paths
+
+        assert validate_paths(sample_input_file, sample_output_dir) == (True, None)
+
+        is_valid, error_msg = validate_paths("/nonexistent/file.jpg", sample_output_dir)
+        assert not is_valid
+        assert "does not exist" in error_msg
+
+        is_valid, error_msg = validate_paths(sample_output_dir, sample_output_dir)
+        assert not is_valid
+        assert "not a file" in error_msg
+
+        is_valid, error_msg = validate_paths(sample_input_file, sample_input_file)
+        assert not is_valid
+        assert "not a directory" in error_msg
+
     def test_output_path_construction(self, sample_input_file, sample_output_dir):
         """Test that output path is constructed correctly."""
         input_path = sample_input_file
@@ -97,6 +213,38 @@ class TestGUILogic:
 
         mock_proc.terminate.assert_called_once()
 
+    def test_shutdown_waits_for_stopped_processes(self):
+        """Test that closing keeps polling while a stopped process is alive."""
+        app, view, proc = MagicMock(), MagicMock(), MagicMock()
+        proc.poll.return_value = None
+        processes = [("/test/input.mp4", proc)]
+        start = time.monotonic()
+
+        main.SightlineApp._poll_shutdown(app, view, processes, start)
+
+        app.after.assert_called_once_with(
+            main.SHUTDOWN_POLL_INTERVAL_MS,
+            app._poll_shutdown,
+            view,
+            processes,
+            start,
+        )
+        view.kill_processes.assert_not_called()
+        app.destroy.assert_not_called()
+
+    def test_shutdown_kills_stopped_processes_after_timeout(self):
+        """Test that processes still alive at the deadline are killed."""
+        app, view, proc = MagicMock(), MagicMock(), MagicMock()
+        proc.poll.return_value = None
+        processes = [("/test/input.mp4", proc)]
+        start = time.monotonic() - main.SHUTDOWN_TIMEOUT_S - 1
+
+        main.SightlineApp._poll_shutdown(app, view, processes, start)
+
+        view.kill_processes.assert_called_once_with(processes)
+        view.cleanup.assert_called_once()
+        app.destroy.assert_called_once()
+
     def test_process_output_reading(self, mock_subprocess):
         """Test that process output is read correctly."""
         mock_popen, _ = mock_subprocess
@@ -0,0 +1,92 @@
+"""Unit tests for progress_parser.py."""
+
+import pytest
+
+from progress_parser import ProgressParser
+
+
+class TestProgressParser:
+    """Tests for ProgressParser.parse."""
+
+    def test_parse_standard_tqdm_line(self):
+        """Test that a standard tqdm line is fully parsed."""
+        parser = ProgressParser()
+
+        assert parser.parse("33%|███▎      | 415/1275 [00:13<00:27, 31.12it/s]\n")
+        assert parser.percentage == 33.0
+        assert parser.current == 415
+        assert parser.total == 1275
+        assert parser.elapsed_seconds == 13
+        assert parser.remaining_seconds == 27
+        assert parser.rate == 31.12
+        assert parser.rate_unit == "it"
+        assert parser.format_eta() == "00:27"
+
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("input.mp4:  33%|███▎      | 415/1275 [00:13<00:27, 31.12it/s]", 415),
+            ("100%|██████████| 10/10 [01:05<00:00, 9.50frames/s]", 10),
+            (" 50%|█████     |5/10 [00:01<00:01,  4.20it/s]", 5),
+        ],
+    )
+    def test_parse_prefixed_and_compact_lines(self, line, expected):
+        """Test that the percentage is found wherever it sits in the line."""
+        parser = ProgressParser()
+
+        assert parser.parse(line)
+        assert parser.current == expected
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "Loading model...",
+            "  0%|          | 0/100 [00:00<?, ?it/s]",
+            " 10%|█         | 1/10 [00:10<01:30, 10.00s/it]",
+            " 10%|█         | 1/10 [00:01<00:09, 1.0it/s, loss=0.5]",
+        ],
+    )
+    def test_parse_rejects_non_progress_lines(self, line):
+        """Test that lines without complete progress information are rejected."""
+        parser = ProgressParser()
+
+        assert not parser.parse(line)
+        assert not parser.is_valid
+
+    def test_format_strings_follow_parsed_values(self):
+        """Test that cached format strings are refreshed when values change."""
+        parser = ProgressParser()
+
+        assert parser.parse(" 10%|█         | 10/100 [00:05<01:30, 2.00it/s]")
+        assert parser.format_eta() == "01:30"
+        assert parser.format_rate() == "2.00 it/s"
+
+        assert (
+            parser.parse(" 11%|█         | 11/100 [00:06<2:10:00, 2.50it/s]") is False
+        )
+        assert parser.parse(" 11%|█         | 11/100 [00:06<130:00, 2.50it/s]")
+        assert parser.format_eta() == "2h 10m"
+        assert parser.format_elapsed() == "00:06"
+        assert parser.format_rate() == "2.50 it/s"
+
+    def test_feed_uses_newest_progress_line(self):
+        """Test that feed keeps the latest progress line of a batch."""
+        parser = ProgressParser()
+
+        assert parser.feed(
+            [
+                " 10%|█         | 10/100 [00:05<00:45, 2.00it/s]",
+                " 20%|██        | 20/100 [00:10<00:40, 2.00it/s]",
+                "Warning: slow frame",
+            ]
+        )
+        assert parser.current == 20
+        assert parser.is_valid
+
+    def test_feed_without_progress_lines(self):
+        """Test that feed reports a batch with no progress lines."""
+        parser = ProgressParser()
+
+        assert not parser.feed(["Loading model...", "done"])
+        assert not parser.feed([])
+        assert not parser.is_valid
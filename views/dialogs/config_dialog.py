@@ -2,6 +2,7 @@
 
 import importlib
 import logging
+import re
 import sys
 import tkinter as tk
 from tkinter import messagebox
@@ -12,8 +13,13 @@ try:
 except ImportError:
     raise ImportError("customtkinter is required for dialog windows")
 
+from views.fonts import get_font
+
 logger = logging.getLogger(__name__)
 
+# Scale in WxH form, e.g. 640x360
+_SCALE_RE = re.compile(r"^(\d+)[xX](\d+)$")
+
 
 def _get_version() -> str:
     """Get the application version from main module."""
@@ -85,7 +91,7 @@ class ConfigDialog(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             main_frame,
             text="Sightline Configuration",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=get_font(20, "bold"),
         )
         title_label.pack(pady=(0, 20))
 
@@ -139,13 +145,13 @@ class ConfigDialog(ctk.CTkToplevel):
         frame.pack(fill="x", pady=5, padx=10)
 
         ctk.CTkLabel(
-            frame, text="Detection Threshold:", font=ctk.CTkFont(size=12)
+            frame, text="Detection Threshold:", font=get_font(12)
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         ctk.CTkLabel(
             frame,
             text="Tune this to trade off between false positive and false negative rate",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="#8ea4c7",  # Mist Blue
         ).pack(anchor="w", padx=10, pady=(0, 5))
 
@@ -158,14 +164,14 @@ class ConfigDialog(ctk.CTkToplevel):
         frame = ctk.CTkFrame(parent)
         frame.pack(fill="x", pady=5, padx=10)
 
-        ctk.CTkLabel(frame, text="Scale (WxH):", font=ctk.CTkFont(size=12)).pack(
+        ctk.CTkLabel(frame, text="Scale (WxH):", font=get_font(12)).pack(
             anchor="w", padx=10, pady=(10, 5)
         )
 
         ctk.CTkLabel(
             frame,
             text="Downscale images for network inference (e.g., 640x360). Leave empty for no scaling.",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="#8ea4c7",  # Mist Blue
         ).pack(anchor="w", padx=10, pady=(0, 5))
 
@@ -181,14 +187,14 @@ class ConfigDialog(ctk.CTkToplevel):
         frame = ctk.CTkFrame(parent)
         frame.pack(fill="x", pady=5, padx=10)
 
-        ctk.CTkLabel(frame, text="Use Boxes:", font=ctk.CTkFont(size=12)).pack(
+        ctk.CTkLabel(frame, text="Use Boxes:", font=get_font(12)).pack(
             anchor="w", padx=10, pady=(10, 5)
         )
 
         ctk.CTkLabel(
             frame,
             text="Use boxes instead of ellipse masks",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="#8ea4c7",  # Mist Blue
         ).pack(anchor="w", padx=10, pady=(0, 5))
 
@@ -204,13 +210,13 @@ class ConfigDialog(ctk.CTkToplevel):
         frame.pack(fill="x", pady=5, padx=10)
 
         ctk.CTkLabel(
-            frame, text="Mask Scale Factor:", font=ctk.CTkFont(size=12)
+            frame, text="Mask Scale Factor:", font=get_font(12)
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         ctk.CTkLabel(
             frame,
             text="Scale factor for face masks to ensure complete face coverage",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="#8ea4c7",  # Mist Blue
         ).pack(anchor="w", padx=10, pady=(0, 5))
 
@@ -224,13 +230,13 @@ class ConfigDialog(ctk.CTkToplevel):
         frame.pack(fill="x", pady=5, padx=10)
 
         ctk.CTkLabel(
-            frame, text="Anonymization Mode:", font=ctk.CTkFont(size=12)
+            frame, text="Anonymization Mode:", font=get_font(12)
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         ctk.CTkLabel(
             frame,
             text="Filter mode for face regions",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="#8ea4c7",  # Mist Blue
         ).pack(anchor="w", padx=10, pady=(0, 5))
 
@@ -246,14 +252,14 @@ class ConfigDialog(ctk.CTkToplevel):
         frame = ctk.CTkFrame(parent)
         frame.pack(fill="x", pady=5, padx=10)
 
-        ctk.CTkLabel(frame, text="Keep Audio:", font=ctk.CTkFont(size=12)).pack(
+        ctk.CTkLabel(frame, text="Keep Audio:", font=get_font(12)).pack(
             anchor="w", padx=10, pady=(10, 5)
         )
 
         ctk.CTkLabel(
             frame,
             text="Keep audio from video source file (only applies to videos)",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="#8ea4c7",  # Mist Blue
         ).pack(anchor="w", padx=10, pady=(0, 5))
 
@@ -269,13 +275,13 @@ class ConfigDialog(ctk.CTkToplevel):
         frame.pack(fill="x", pady=5, padx=10)
 
         ctk.CTkLabel(
-            frame, text="Keep Metadata:", font=ctk.CTkFont(size=12)
+            frame, text="Keep Metadata:", font=get_font(12)
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         ctk.CTkLabel(
             frame,
             text="Keep metadata of the original image",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="#8ea4c7",  # Mist Blue
         ).pack(anchor="w", padx=10, pady=(0, 5))
 
@@ -291,13 +297,13 @@ class ConfigDialog(ctk.CTkToplevel):
         frame.pack(fill="x", pady=5, padx=10)
 
         ctk.CTkLabel(
-            frame, text="Batch Size:", font=ctk.CTkFont(size=12)
+            frame, text="Batch Size:", font=get_font(12)
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         ctk.CTkLabel(
             frame,
             text=f"Number of files to process concurrently (1-{self.MAX_BATCH_SIZE})",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="#8ea4c7",  # Mist Blue
         ).pack(anchor="w", padx=10, pady=(0, 5))
 
@@ -311,13 +317,13 @@ class ConfigDialog(ctk.CTkToplevel):
         frame.pack(fill="x", pady=5, padx=10)
 
         ctk.CTkLabel(
-            frame, text="Hugging Face Token:", font=ctk.CTkFont(size=12)
+            frame, text="Hugging Face Token:", font=get_font(12)
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         ctk.CTkLabel(
             frame,
             text="Token for accessing Hugging Face models (required for transcription features)",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             text_color="#8ea4c7",  # Mist Blue
         ).pack(anchor="w", padx=10, pady=(0, 5))
 
@@ -380,20 +386,15 @@ class ConfigDialog(ctk.CTkToplevel):
             )
             return None
 
-        try:
-            parts = scale_val.lower().split("x")
-            if len(parts) != 2:
-                raise ValueError
-            int(parts[0])
-            int(parts[1])
-            return scale_val
-        except ValueError:
+        if not _SCALE_RE.match(scale_val):
             messagebox.showerror(
                 "Error",
                 "Scale must be in format WxH with valid integers (e.g., 640x360).",
             )
             return None
 
+        return scale_val
+
     def _validate_mask_scale(self) -> Optional[float]:
         """Validate mask scale input.
 
@@ -485,5 +486,5 @@ class ConfigDialog(ctk.CTkToplevel):
 
     def _create_section_header(self, parent, text):
         """Create a section header."""
-        header = ctk.CTkLabel(parent, text=text, font=ctk.CTkFont(size=16, weight="bold"))
+        header = ctk.CTkLabel(parent, text=text, font=get_font(16, "bold"))
         header.pack(anchor="w", padx=10, pady=(0, 10))
@@ -12,6 +12,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Tk's text widget slows down with every line it holds, so very long logs are
+# trimmed to their most recent lines before display
+MAX_DISPLAY_LINES = 5000
+
 
 class LogDialog(ctk.CTkToplevel):
     """Dialog for displaying error logs."""
@@ -53,6 +57,24 @@ class LogDialog(ctk.CTkToplevel):
 
         self.geometry(f"+{x}+{y}")
 
+    @staticmethod
+    def _tail(log_text: str) -> str:
+        """Limit a log to its last MAX_DISPLAY_LINES lines.
+
+        Args:
+            log_text: Full log text.
+
+        Returns:
+            The log text, prefixed with a note when earlier lines were dropped.
+        """
+        lines = log_text.splitlines(keepends=True)
+        omitted = len(lines) - MAX_DISPLAY_LINES
+        if omitted <= 0:
+            return log_text
+        return f"... {omitted} earlier lines omitted ...\n" + "".join(
+            lines[omitted:]
+        )
+
     def _create_widgets(self, log_text: str):
         """Create and layout all dialog widgets."""
         main_frame = ctk.CTkFrame(self, border_width=0, fg_color="transparent")
@@ -71,7 +93,7 @@ class LogDialog(ctk.CTkToplevel):
             wrap="word",
         )
         log_textbox.pack(fill="both", expand=True, pady=(0, 10))
-        log_textbox.insert("1.0", log_text)
+        log_textbox.insert("1.0", self._tail(log_text))
         log_textbox.configure(state="disabled")
 
         button_frame = ctk.CTkFrame(main_frame, border_width=0, fg_color="transparent")
@@ -5,11 +5,9 @@ This module contains the UI and logic for batch processing files with face blurr
 
 import logging
 import os
-import subprocess
-import threading
 from pathlib import Path
 from tkinter import filedialog
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 try:
     import customtkinter as ctk
@@ -40,6 +38,9 @@ SUPPORTED_EXTENSIONS = {
 class FaceBlurView(GenericBatchView):
     """View for batch processing files with face blurring."""
 
+    # deface draws its tqdm bar on stderr; stdout only carries messages
+    progress_streams = ("stderr",)
+
     def __init__(self, parent: ctk.CTk, app: Any):
         """Initialize the face blur batch processing view.
 
@@ -55,6 +56,9 @@ class FaceBlurView(GenericBatchView):
             generate_output_filename=self._generate_output_filename,
         )
 
+        # deface arguments for the running batch, built by _prepare_batch
+        self._deface_args: List[str] = []
+
     def _generate_output_filename(self, input_path: str) -> str:
         """Generate output filename for face blurring.
 
@@ -68,6 +72,10 @@ class FaceBlurView(GenericBatchView):
         name, ext = os.path.splitext(input_filename)
         return f"{name}_anonymized{ext}"
 
+    def _prepare_batch(self):
+        """Build the deface arguments once; the config is fixed during a batch."""
+        self._deface_args = self.app.build_deface_args(self.app.config)
+
     def _process_file(self, file_info: Dict[str, Any]):
         """Process a single file with face blurring.
 
@@ -82,36 +90,31 @@ class FaceBlurView(GenericBatchView):
         # Update status to processing
         file_info["status"] = "processing"
         file_info["progress"] = 0.0
-        file_info["error_log"] = ""
+        file_info["error_log"].clear()
         file_info["parser"] = self._create_progress_parser()  # Reset progress parser for this file
-        self.output_queue.put(("file_update", file_path))
+        self._post_output(("file_update", file_path))
 
         try:
             # Start the subprocess with current configuration
-            proc = self.app.run_deface(file_path, output_path, self.app.config)
-            self.active_processes[file_path] = proc
-
-            # Start threads to read stdout and stderr concurrently
-            stdout_thread = threading.Thread(
-                target=self._read_stream,
-                args=(proc.stdout, "stdout", file_path),
-                daemon=True,
-            )
-            stderr_thread = threading.Thread(
-                target=self._read_stream,
-                args=(proc.stderr, "stderr", file_path),
-                daemon=True,
+            proc = self.app.run_deface(
+                file_path, output_path, extra_args=self._deface_args
             )
+            self._track_process(file_path, proc)
 
-            stdout_thread.start()
-            stderr_thread.start()
+            # Forward stdout and stderr to the UI while the process runs
+            output_done = self._watch_process_output(proc, file_path)
 
             # Wait for process to complete
             return_code = proc.wait()
 
-            # Wait for both reading threads to finish
-            stdout_thread.join(timeout=1)
-            stderr_thread.join(timeout=1)
+            # Wait for the reader to drain whatever is left in the pipes. If
+            # something else still holds them open, don't block the worker
+            if not output_done.wait(timeout=1):
+                logger.warning(
+                    "Output of %s still open after exit; "
+                    "remaining lines may be missing from the log",
+                    file_path,
+                )
 
             # Update file status based on return code
             if return_code == 0:
@@ -121,22 +124,18 @@ class FaceBlurView(GenericBatchView):
             else:
                 file_info["status"] = "failed"
                 file_info["progress"] = 0.0
-                file_info["error_log"] += f"\nProcess exited with code {return_code}"
+                file_info["error_log"].append(
+                    f"\nProcess exited with code {return_code}"
+                )
                 logger.error(
                     f"Failed to process {file_path} (exit code: {return_code})"
                 )
 
-            self.output_queue.put(("file_update", file_path))
+            self._post_output(("file_update", file_path))
 
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {e}")
             file_info["status"] = "failed"
             file_info["progress"] = 0.0
-            file_info["error_log"] += f"\nException: {str(e)}"
-            self.output_queue.put(("file_update", file_path))
-            if file_path in self.currently_processing:
-                self.currently_processing.remove(file_path)
-        finally:
-            # Clean up process tracking
-            if file_path in self.active_processes:
-                del self.active_processes[file_path]
+            file_info["error_log"].append(f"\nException: {str(e)}")
+            self._post_output(("file_update", file_path))
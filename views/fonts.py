@@ -0,0 +1,26 @@
+"""Shared fonts for Sightline views and dialogs.
+
+CTkFont objects are created on first use (they need a Tk root) and then
+reused, instead of building a new font for every label.
+"""
+
+from functools import lru_cache
+
+try:
+    import customtkinter as ctk
+except ImportError:
+    raise ImportError("customtkinter is required for views")
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Get a shared font of the given size and weight.
+
+    Args:
+        size: Font size in points.
+        weight: Font weight ("normal" or "bold").
+
+    Returns:
+        A CTkFont shared by all callers asking for the same size and weight.
+    """
+    return ctk.CTkFont(size=size, weight=weight)
@@ -4,31 +4,58 @@ This module provides a reusable base class for batch processing files with
 configurable processing logic, file types, and UI elements.
 """
 
+import collections
 import logging
 import os
 import queue
+import re
+import selectors
+import signal
+import stat
 import subprocess
 import sys
 import threading
 import time
 import tkinter as tk
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 import customtkinter as ctk
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
 from views.dialogs import LogDialog
 from progress_parser import ProgressParser
 from views.base_view import BaseView
+from views.fonts import get_font
 
 logger = logging.getLogger(__name__)
 
 # View constants
 FILE_LIST_HEIGHT = 300
 MAX_FILENAME_DISPLAY_LENGTH = 35
+MAX_BATCH_SIZE = 8
 PROGRESS_CHECK_INTERVAL_MS = 50
+# Longest poll interval while a batch runs without producing output
+IDLE_CHECK_INTERVAL_MS = 200
+# Longest time one poll spends handling output before yielding to Tk; the
+# clock is checked every OUTPUT_BUDGET_CHECK_EVERY messages
+OUTPUT_DRAIN_BUDGET_S = 0.02
+OUTPUT_BUDGET_CHECK_EVERY = 64
+STREAM_READ_SIZE = 65536
+PROCESS_STOP_TIMEOUT_S = 5
+CLEANUP_STOP_TIMEOUT_S = 2
+SCANDIR_GROUP_THRESHOLD = 100
+
+# File list geometry, in unscaled CTk units. Each file occupies a fixed-height
+# slot so the list can be virtualized: only the rows in view have widgets.
+LIST_ROW_HEIGHT = 100
+LIST_ROW_GAP = 10
+LIST_SCROLL_UNIT = 30
+MAX_ERROR_LOG_LINES = 5000
+# Progress bar width assumed until a row's bar reports its real size
+DEFAULT_PROGRESS_BAR_WIDTH = 200
 
 # Status colors for file processing - Sightline brand colors
 STATUS_COLORS = {
@@ -38,8 +65,217 @@ STATUS_COLORS = {
     "failed": ("#ff3b30", "Failed"),  # Ember Red
 }
 
+# Row text and progress bar color per status, looked up on every row update
+STATUS_LABELS = {
+    status: "complete" if text == "Success" else text
+    for status, (_, text) in STATUS_COLORS.items()
+}
+PROGRESS_COLORS = {"success": "#00FF9C", "failed": "#ff3b30"}
+DEFAULT_PROGRESS_COLOR = "#00a6ff"
+
+# Inline notice colors, and how long a notice stays up
+STATUS_LINE_COLORS = {"info": "#8ea4c7", "warning": "#ffb020"}
+STATUS_LINE_CLEAR_MS = 3000
+
 # Keywords for error detection in logs
 ERROR_KEYWORDS = ["error", "warning", "exception", "failed", "traceback"]
+# Matched against lower-cased lines: one regex scan beats a substring test per
+# keyword, and is faster than re.IGNORECASE
+ERROR_PATTERN = re.compile("|".join(ERROR_KEYWORDS))
+_ERROR_PATTERN_BYTES = re.compile("|".join(ERROR_KEYWORDS).encode())
+
+# Line breaks in subprocess output; tqdm redraws its bar with bare carriage returns
+LINE_BREAK_PATTERN = re.compile(rb"\r\n|\r|\n")
+
+
+@dataclass
+class ProcessSlot:
+    """A file being processed by a batch worker.
+
+    Attributes:
+        file_info: The file's queue entry.
+        proc: Its subprocess, or None until one has been started.
+    """
+
+    __slots__ = ("file_info", "proc")
+
+    file_info: Dict[str, Any]
+    proc: Optional[subprocess.Popen]
+
+
+@dataclass
+class StreamWatch:
+    """End-of-file bookkeeping shared by the output streams of one process.
+
+    Attributes:
+        open_streams: Number of streams not yet read to EOF.
+        done: Set once every stream has been read to EOF.
+    """
+
+    __slots__ = ("open_streams", "done")
+
+    open_streams: int
+    done: threading.Event
+
+
+def _is_relevant_line(line: bytes, marker: Optional[bytes]) -> bool:
+    """Check whether a raw output line is used by the UI at all.
+
+    Only progress lines and lines that look like errors or warnings are ever
+    shown; everything else is dropped before it is decoded.
+
+    Args:
+        line: Raw line without its line break.
+        marker: Substring every progress line contains, or None if any line
+            may carry progress.
+
+    Returns:
+        True if the line may carry progress or belongs in the error log.
+    """
+    if marker is None or marker in line:
+        return True
+    return _ERROR_PATTERN_BYTES.search(line.lower()) is not None
+
+
+def _pop_lines(buf: bytearray, marker: Optional[bytes]) -> List[str]:
+    """Remove all complete lines from the front of a byte buffer.
+
+    Mirrors universal-newlines mode: CRLF, CR and LF all end a line, and
+    every returned line is decoded and terminated with a single LF. Any
+    trailing partial line is left in the buffer. Lines the UI has no use
+    for are discarded undecoded.
+
+    Args:
+        buf: Buffer of raw bytes read from a subprocess pipe.
+        marker: Substring every progress line contains, or None to keep
+            every line.
+
+    Returns:
+        List of decoded, non-empty progress and error lines.
+    """
+    end = max(buf.rfind(b"\n"), buf.rfind(b"\r"))
+    if end < 0:
+        return []
+
+    complete = bytes(buf[: end + 1])
+    del buf[: end + 1]
+    return [
+        line.decode("utf-8", errors="replace") + "\n"
+        for line in LINE_BREAK_PATTERN.split(complete)
+        if line and _is_relevant_line(line, marker)
+    ]
+
+
+def _worker_count(batch_size: Any) -> int:
+    """Get the number of concurrent workers for a configured batch size.
+
+    The config file can be edited by hand, so the value is clamped to
+    1..MAX_BATCH_SIZE and anything that is not a number falls back to 1.
+
+    Args:
+        batch_size: The "batch_size" value from the configuration.
+
+    Returns:
+        Number of files to process at once.
+    """
+    try:
+        count = int(batch_size)
+    except (TypeError, ValueError):
+        logger.warning("Invalid batch size %r, using 1", batch_size)
+        return 1
+    return max(1, min(count, MAX_BATCH_SIZE))
+
+
+def _path_kinds(paths: List[str]) -> Dict[str, Optional[str]]:
+    """Find out whether each path is a file, a directory or missing.
+
+    Paths are grouped by parent directory. A group with more than
+    SCANDIR_GROUP_THRESHOLD members is answered from a single os.scandir() of
+    the parent, whose entries carry their type from the directory read,
+    instead of one stat() call per path (slow on network shares).
+
+    Args:
+        paths: Paths to classify.
+
+    Returns:
+        Dictionary mapping each path to "file", "dir" or None if it does
+        not exist.
+    """
+    groups: Dict[str, List[str]] = {}
+    for path in paths:
+        groups.setdefault(os.path.dirname(path), []).append(path)
+
+    kinds: Dict[str, Optional[str]] = {}
+    for parent, group in groups.items():
+        entries: Dict[str, os.DirEntry] = {}
+        if len(group) > SCANDIR_GROUP_THRESHOLD:
+            try:
+                with os.scandir(parent or ".") as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError as e:
+                logger.debug("Could not scan %s: %s", parent, e)
+
+        for path in group:
+            entry = entries.get(os.path.basename(path))
+            if entry is not None:
+                is_dir, is_file = entry.is_dir(), entry.is_file()
+            else:
+                # One stat() answers both questions
+                try:
+                    mode = os.stat(path).st_mode
+                except (OSError, ValueError):
+                    mode = 0
+                is_dir, is_file = stat.S_ISDIR(mode), stat.S_ISREG(mode)
+            kinds[path] = "dir" if is_dir else "file" if is_file else None
+
+    return kinds
+
+
+def _signal_process(proc: subprocess.Popen, kill: bool = False) -> None:
+    """Terminate or kill a subprocess together with any children it spawned.
+
+    On POSIX the subprocess is started in its own session, so its process
+    group id equals its pid and the whole group can be signalled at once.
+    Windows falls back to signalling just the process.
+
+    Args:
+        proc: The subprocess to stop.
+        kill: Send SIGKILL instead of SIGTERM.
+    """
+    if sys.platform != "win32":
+        try:
+            os.killpg(proc.pid, signal.SIGKILL if kill else signal.SIGTERM)
+            return
+        except (ProcessLookupError, PermissionError):
+            # Not a group leader (or already gone); signal the process itself
+            pass
+
+    if kill:
+        proc.kill()
+    else:
+        proc.terminate()
+
+
+def _reap_processes(
+    processes: List[Tuple[str, subprocess.Popen]], timeout: float
+) -> None:
+    """Wait for already-terminated subprocesses, killing stragglers.
+
+    All processes share one deadline, so the total wait is bounded by
+    `timeout` however many processes there are.
+
+    Args:
+        processes: (file_path, process) tuples that have been signalled.
+        timeout: Seconds to wait in total before killing what is left.
+    """
+    deadline = time.monotonic() + timeout
+    for file_path, proc in processes:
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            logger.warning("Process did not terminate, killing: %s", file_path)
+            _signal_process(proc, kill=True)
+
 
 class GenericBatchView(BaseView, ABC):
     """Generic base view for batch processing files.
@@ -48,6 +284,15 @@ class GenericBatchView(BaseView, ABC):
     configurable processing logic, file types, and custom widgets.
     """
 
+    # Subprocess streams that may carry tqdm progress; lines from other
+    # streams are only checked for errors
+    progress_streams: Tuple[str, ...] = ("stdout", "stderr")
+
+    # Substring every progress line contains. Other lines are dropped unless
+    # they look like errors, so a view whose _create_progress_parser reads a
+    # different format must change this, or set it to None to pass every line
+    progress_marker: Optional[str] = ProgressParser.LINE_MARKER
+
     def __init__(
         self,
         parent: ctk.CTk,
@@ -75,14 +320,49 @@ class GenericBatchView(BaseView, ABC):
 
         # File queue for batch processing
         self.file_queue: List[Dict[str, Any]] = []
-        self.currently_processing: set[str] = set()
+        # Path -> file info for every entry of file_queue
+        self.file_index: Dict[str, Dict[str, Any]] = {}
         self.is_processing: bool = False
-        self.stop_requested: bool = False
+        # Stop signal of the current batch. Every batch gets its own event,
+        # so finishing or starting a batch can never un-stop the workers of
+        # an earlier one that are still winding down.
+        self._batch_stop = threading.Event()
         self.file_widgets: Dict[str, Dict[str, Any]] = {}
-        self.active_processes: Dict[str, subprocess.Popen] = {}
-
-        # Process tracking
-        self.output_queue: queue.Queue = queue.Queue()
+        # Path -> slot for every file a batch worker is processing
+        self.active: Dict[str, ProcessSlot] = {}
+
+        # Guards active, which is updated from worker threads; needed for
+        # free-threaded (no-GIL) builds
+        self._state_lock = threading.Lock()
+
+        # Process tracking: worker threads append messages under the lock and
+        # the Tk thread swaps the whole buffer out once per poll
+        self._output_lock = threading.Lock()
+        self._output_buffer: Deque[Tuple] = collections.deque()
+        self._output_event = threading.Event()
+
+        # Subprocess pipes: on POSIX a single selector thread reads the output
+        # of every running process; Windows cannot poll anonymous pipes, so
+        # there each stream gets its own reader thread
+        self._reader_lock = threading.Lock()
+        self._stream_selector: Optional[selectors.BaseSelector] = None
+        self._reader_thread: Optional[threading.Thread] = None
+        # Subprocess streams not yet read to EOF. Polling continues while any
+        # are open, since their last lines can arrive after batch_done.
+        self._open_streams = 0
+
+        # Error-log lines collected during one poll, appended once per file
+        self._pending_log_lines: Dict[str, List[str]] = {}
+
+        # Progress-stream lines collected during one poll, parsed once per file
+        self._pending_progress: Dict[str, List[str]] = {}
+
+        # Rows changed during one poll; each is redrawn once at the end
+        self._dirty_rows: Set[str] = set()
+
+        # Files that finished during one poll; their parsers are released
+        # after the poll's remaining progress output has been parsed
+        self._finished_files: Set[str] = set()
 
         # Create widgets
         self.create_widgets()
@@ -91,8 +371,16 @@ class GenericBatchView(BaseView, ABC):
         self._drop_handler: Optional[Callable[[Any], str]] = None
         self._drag_drop_setup = False
 
-        # Start checking for process output
-        self._check_process_output()
+        # Output polling runs only while a batch is active, and backs off
+        # while no output arrives
+        self._polling = False
+        self._poll_interval_ms = PROGRESS_CHECK_INTERVAL_MS
+
+        # Rows changed while the view is hidden or the window minimized are
+        # redrawn once it is mapped again. The toplevel binding sees both the
+        # window being restored and this view being packed.
+        self._stale_rows: Set[str] = set()
+        self.winfo_toplevel().bind("<Map>", self._on_map, add="+")
 
     def _default_output_filename(self, input_path: str) -> str:
         """Generate default output filename from input path.
@@ -127,7 +415,7 @@ class GenericBatchView(BaseView, ABC):
             fg_color="transparent",
             text_color=("black", "white"),
             hover=False,
-            font=ctk.CTkFont(size=16),
+            font=get_font(16),
         )
         back_btn.pack(side="left")
 
@@ -135,7 +423,7 @@ class GenericBatchView(BaseView, ABC):
         title_label = ctk.CTkLabel(
             header_frame,
             text=self.page_title,
-            font=ctk.CTkFont(size=36, weight="bold"),
+            font=get_font(36, "bold"),
         )
         title_label.pack(side="left", expand=True)
 
@@ -156,7 +444,7 @@ class GenericBatchView(BaseView, ABC):
         ctk.CTkLabel(
             left_frame,
             text="Output Destination",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(14, "bold")
         ).pack(anchor="w", pady=(0, 5))
 
         output_row = ctk.CTkFrame(left_frame, fg_color="transparent", border_width=0)
@@ -195,26 +483,54 @@ class GenericBatchView(BaseView, ABC):
         self.right_frame = ctk.CTkFrame(content_frame, fg_color="transparent", border_width=0)
         self.right_frame.grid(row=0, column=1, sticky="nsew")
 
-        # Scrollable list
-        self.files_list_frame = ctk.CTkScrollableFrame(
-            self.right_frame,
-            fg_color="transparent"
+        # Virtualized list: a small pool of row widgets is placed over the
+        # visible part of the queue and rebound to other files on scroll
+        self.files_scrollbar = ctk.CTkScrollbar(
+            self.right_frame, command=self._on_list_scrollbar
+        )
+        self.files_scrollbar.pack(side="right", fill="y", pady=5)
+
+        self.files_list_frame = ctk.CTkFrame(
+            self.right_frame, fg_color="transparent", border_width=0
         )
-        self.files_list_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        self.files_list_frame.pack(
+            side="left", fill="both", expand=True, padx=5, pady=5
+        )
+        self.files_list_frame.bind("<Configure>", self._render_file_list, add="+")
+
+        self._list_top = 0.0
+        self._row_pool: List[Dict[str, Any]] = []
+
+        if sys.platform.startswith("linux"):
+            self.bind_all("<Button-4>", self._on_list_mouse_wheel, add="+")
+            self.bind_all("<Button-5>", self._on_list_mouse_wheel, add="+")
+        else:
+            self.bind_all("<MouseWheel>", self._on_list_mouse_wheel, add="+")
 
         # Placeholder
         self.no_files_label = ctk.CTkLabel(
             self.files_list_frame,
             text="Drag and drop files here",
-            font=ctk.CTkFont(size=16),
+            font=get_font(16),
             text_color="#8ea4c7",
         )
-        self.no_files_label.pack(pady=100)
+        self.no_files_label.place(relx=0.5, rely=0.5, anchor="center")
 
         # --- Bottom Controls ---
         button_frame = ctk.CTkFrame(self, fg_color="transparent")
         button_frame.grid(row=2, column=0, sticky="e", padx=20, pady=20)
 
+        # Inline notices that need no acknowledgement; a modal box would
+        # block the window while a batch is running
+        self._status_line = ctk.CTkLabel(
+            button_frame,
+            text="",
+            font=get_font(13),
+            text_color=STATUS_LINE_COLORS["info"],
+        )
+        self._status_line.pack(side="left", padx=(0, 20))
+        self._status_clear_job: Optional[str] = None
+
         select_files_btn = ctk.CTkButton(
             button_frame,
             text="Select Files",
@@ -239,6 +555,26 @@ class GenericBatchView(BaseView, ABC):
         )
         self.start_stop_btn.pack(side="left")
 
+    def _flash_status(self, text: str, level: str = "info") -> None:
+        """Show a short notice next to the buttons and clear it after a while.
+
+        Args:
+            text: Notice to show.
+            level: "info" or "warning"; selects the text color.
+        """
+        if self._status_clear_job is not None:
+            self.after_cancel(self._status_clear_job)
+        color = STATUS_LINE_COLORS.get(level, STATUS_LINE_COLORS["info"])
+        self._status_line.configure(text=text, text_color=color)
+        self._status_clear_job = self.after(
+            STATUS_LINE_CLEAR_MS, self._clear_status
+        )
+
+    def _clear_status(self) -> None:
+        """Clear the inline notice."""
+        self._status_clear_job = None
+        self._status_line.configure(text="")
+
     def _create_custom_widgets(self, parent: ctk.CTkFrame) -> None:
         """Create custom widgets in the left panel below output folder selection.
 
@@ -249,21 +585,22 @@ class GenericBatchView(BaseView, ABC):
         """
         pass
 
-    def _create_file_row(self, file_info: Dict[str, Any]) -> ctk.CTkFrame:
-        """Create a UI row for a file in the queue.
+    def _create_row(self) -> Dict[str, Any]:
+        """Create the widgets for one pooled file row.
 
-        Args:
-            file_info: Dictionary containing file information.
+        The row is not bound to a file yet; `_bind_row` fills it in.
 
         Returns:
-            Frame containing the file row widgets.
+            Dictionary of the row's widgets and the path it currently shows.
         """
-        file_path = file_info["path"]
-        filename = os.path.basename(file_path)
-
         # Card Frame with border and rounded corners
-        row_frame = ctk.CTkFrame(self.files_list_frame, border_width=2, corner_radius=15)
-        row_frame.pack(fill="x", pady=5, padx=5)
+        row_frame = ctk.CTkFrame(
+            self.files_list_frame,
+            height=LIST_ROW_HEIGHT - LIST_ROW_GAP,
+            border_width=2,
+            corner_radius=15,
+        )
+        row_frame.pack_propagate(False)
 
         # Inner padding frame
         inner = ctk.CTkFrame(row_frame, fg_color="transparent")
@@ -274,88 +611,98 @@ class GenericBatchView(BaseView, ABC):
         top_row.pack(fill="x", pady=(0, 5))
 
         # Icon (Placeholder - simple text or emoji)
-        icon_char = self._get_file_icon(file_path)
-        icon_label = ctk.CTkLabel(top_row, text=icon_char, width=30, font=ctk.CTkFont(size=20))
+        icon_label = ctk.CTkLabel(top_row, text="", width=30, font=get_font(20))
         icon_label.pack(side="left")
 
         # Filename
-        display_name = filename
-        if len(filename) > MAX_FILENAME_DISPLAY_LENGTH:
-            display_name = filename[: MAX_FILENAME_DISPLAY_LENGTH - 3] + "..."
-
         name_label = ctk.CTkLabel(
             top_row,
-            text=display_name,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            text="",
+            font=get_font(14, "bold"),
             anchor="w"
         )
         name_label.pack(side="left", padx=5, fill="x", expand=True)
 
         # Status (Clickable)
-        status = file_info.get("status", "pending")
-        color, text = STATUS_COLORS.get(status, ("gray", "Pending"))
-        if text == "Success":
-            text = "complete"
-
         status_label = ctk.CTkLabel(
             top_row,
-            text=text,
-            font=ctk.CTkFont(size=12),
+            text="",
+            font=get_font(12),
             text_color=("black", "white"),
             cursor="hand2"
         )
         status_label.pack(side="right")
 
-        # Bind click to show logs
-        status_label.bind("<Button-1>", lambda e: self._show_file_logs(file_path))
-
         # Progress Bar
         progress_bar = ctk.CTkProgressBar(inner)
         progress_bar.pack(fill="x", pady=(0, 5))
-        progress_bar.set(file_info.get("progress", 0.0))
 
         # Bottom Row: Details
         details_row = ctk.CTkFrame(inner, fg_color="transparent")
         details_row.pack(fill="x")
 
         # Duration / Remaining
-        eta_text = "--:--"
-        if file_info.get("status") == "success":
-            eta_text = f"duration: {file_info.get('elapsed', '00:00')}"
-        elif file_info.get("status") == "processing":
-            eta_text = f"Remaining: {file_info.get('eta', '--:--')}"
-
         eta_label = ctk.CTkLabel(
             details_row,
-            text=eta_text,
-            font=ctk.CTkFont(size=11),
+            text="--:--",
+            font=get_font(11),
         )
         eta_label.pack(side="left")
 
         # Speed
-        speed = file_info.get("speed", "--")
-        if speed == "--":
-            speed_text = f"Speed {speed} it/s"
-        else:
-            speed_text = f"Speed {speed}"
-
         speed_label = ctk.CTkLabel(
             details_row,
-            text=speed_text,
-            font=ctk.CTkFont(size=11),
+            text="",
+            font=get_font(11),
         )
         speed_label.pack(side="right")
 
-        # Store widget references
-        self.file_widgets[file_path] = {
+        row = {
+            "path": None,
+            # Offset the row is placed at, or None while it is unused
+            "y": None,
+            "shown": None,
+            "last": {},
+            "bar_width": DEFAULT_PROGRESS_BAR_WIDTH,
             "row_frame": row_frame,
+            "icon_label": icon_label,
+            "name_label": name_label,
             "status_label": status_label,
             "progress_bar": progress_bar,
             "eta_label": eta_label,
             "speed_label": speed_label,
         }
 
-        return row_frame
+        # Bind click to show logs of whichever file the row currently shows
+        status_label.bind("<Button-1>", lambda e: self._show_file_logs(row["path"]))
+
+        # Track the bar's drawn width so progress is only redrawn when it
+        # moves the bar by at least a pixel
+        progress_bar.bind(
+            "<Configure>", lambda e: row.update(bar_width=max(e.width, 1)), add="+"
+        )
+
+        return row
+
+    def _bind_row(self, row: Dict[str, Any], file_info: Dict[str, Any]):
+        """Show a file in a pooled row.
+
+        Args:
+            row: Row widgets created by `_create_row`.
+            file_info: Dictionary containing file information.
+        """
+        file_path = file_info["path"]
+        self.file_widgets[file_path] = row
+        if row["path"] == file_path:
+            return
+
+        row["path"] = file_path
+        row["shown"] = None
+        row["last"] = {}
+
+        row["icon_label"].configure(text=self._get_file_icon(file_path))
+        row["name_label"].configure(text=file_info["display_name"])
+        self._update_file_row(file_path)
 
     def _get_file_icon(self, file_path: str) -> str:
         """Get an icon character for a file based on its extension.
@@ -385,12 +732,12 @@ class GenericBatchView(BaseView, ABC):
         if file_path not in self.file_widgets:
             return
 
+        if not self.winfo_viewable():
+            self._stale_rows.add(file_path)
+            return
+
         # Find file info
-        file_info = None
-        for f in self.file_queue:
-            if f["path"] == file_path:
-                file_info = f
-                break
+        file_info = self.file_index.get(file_path)
 
         if not file_info:
             return
@@ -398,103 +745,267 @@ class GenericBatchView(BaseView, ABC):
         widgets = self.file_widgets[file_path]
         status = file_info["status"]
         progress = file_info["progress"]
-
-        color, text = STATUS_COLORS.get(status, ("gray", "Unknown"))
-        if text == "Success":
-            text = "complete"
-
-        # Update status text
-        widgets["status_label"].configure(text=text)
-        widgets["progress_bar"].set(progress)
-
-        # Update progress bar color
-        if status == "success":
-            widgets["progress_bar"].configure(progress_color="#00FF9C")
-        elif status == "failed":
-            widgets["progress_bar"].configure(progress_color="#ff3b30")
-        else:
-            widgets["progress_bar"].configure(progress_color="#00a6ff")
-
-        # Update details
         eta = file_info.get("eta", "--:--")
         elapsed = file_info.get("elapsed", "00:00")
         speed = file_info.get("speed", "--")
 
+        # Skip rows whose visible state has not changed since the last redraw
+        shown = (status, progress, eta, elapsed, speed)
+        if widgets["shown"] == shown:
+            return
+        widgets["shown"] = shown
+
+        text = STATUS_LABELS.get(status, "Unknown")
+        progress_color = PROGRESS_COLORS.get(status, DEFAULT_PROGRESS_COLOR)
+
+        # Details
         if status == "processing":
-            widgets["eta_label"].configure(text=f"Remaining: {eta}")
+            eta_text = f"Remaining: {eta}"
         elif status == "success":
-            widgets["eta_label"].configure(text=f"duration: {elapsed}")
+            eta_text = f"duration: {elapsed}"
         elif status == "failed":
-            widgets["eta_label"].configure(text="failed")
+            eta_text = "failed"
         else:
-            widgets["eta_label"].configure(text="--:--")
+            eta_text = "--:--"
 
         if speed == "--":
-            widgets["speed_label"].configure(text=f"Speed {speed} it/s")
+            speed_text = f"Speed {speed} it/s"
         else:
-            widgets["speed_label"].configure(text=f"Speed {speed}")
+            speed_text = f"Speed {speed}"
+
+        # Only touch the widgets whose value actually changed
+        last = widgets["last"]
+        if last.get("status") != text:
+            widgets["status_label"].configure(text=text)
+            last["status"] = text
+
+        progress_px = int(progress * widgets["bar_width"])
+        if last.get("progress_px") != progress_px:
+            widgets["progress_bar"].set(progress)
+            last["progress_px"] = progress_px
+
+        if last.get("progress_color") != progress_color:
+            widgets["progress_bar"].configure(progress_color=progress_color)
+            last["progress_color"] = progress_color
+
+        if last.get("eta") != eta_text:
+            widgets["eta_label"].configure(text=eta_text)
+            last["eta"] = eta_text
+
+        if last.get("speed") != speed_text:
+            widgets["speed_label"].configure(text=speed_text)
+            last["speed"] = speed_text
+
+    def _on_map(self, event: Optional[Any] = None):
+        """Redraw rows that changed while the view was not viewable.
+
+        Args:
+            event: Optional event parameter for compatibility with bindings.
+        """
+        if not self._stale_rows or not self.winfo_viewable():
+            return
+
+        stale_rows = self._stale_rows
+        self._stale_rows = set()
+        for file_path in stale_rows:
+            self._update_file_row(file_path)
 
     def _refresh_file_list_display(self):
         """Refresh the entire file list display."""
-        # Clear existing widgets
-        for widgets in self.file_widgets.values():
-            widgets["row_frame"].destroy()
-        self.file_widgets.clear()
+        # Rebind every visible row, since the files behind them may differ
+        for row in self._row_pool:
+            row["path"] = None
 
         # Show/hide placeholder
         if not self.file_queue:
-            self.no_files_label.pack(pady=100)
+            self.no_files_label.place(relx=0.5, rely=0.5, anchor="center")
             self.start_stop_btn.configure(state="disabled")
         else:
-            self.no_files_label.pack_forget()
+            self.no_files_label.place_forget()
             if not self.is_processing:
                 self.start_stop_btn.configure(state="normal", text="Start", command=self._start_processing)
 
-            # Create rows for all files
-            for file_info in self.file_queue:
-                self._create_file_row(file_info)
-                self._update_file_row(file_info["path"])
+        self._render_file_list()
+
+    def _render_file_list(self, event: Optional[Any] = None):
+        """Place pooled rows over the files in the visible part of the list.
+
+        Args:
+            event: Optional event parameter for compatibility with bindings.
+        """
+        scaling = self._get_widget_scaling()
+        viewport = self.files_list_frame.winfo_height() / scaling
+        content = len(self.file_queue) * LIST_ROW_HEIGHT
+
+        self._list_top = max(0.0, min(self._list_top, content - viewport))
+        first = int(self._list_top // LIST_ROW_HEIGHT)
+        visible = max(
+            0, min(len(self.file_queue) - first, int(viewport // LIST_ROW_HEIGHT) + 2)
+        )
+
+        while len(self._row_pool) < visible:
+            self._row_pool.append(self._create_row())
+
+        self.file_widgets = {}
+        for i, row in enumerate(self._row_pool):
+            if i < visible:
+                index = first + i
+                y = index * LIST_ROW_HEIGHT - self._list_top + LIST_ROW_GAP // 2
+                # Rows that did not move (e.g. when files are appended) keep
+                # their placement instead of going through the geometry
+                # manager again
+                if row["y"] != y:
+                    row["row_frame"].place(x=0, y=y, relwidth=1)
+                    row["y"] = y
+                self._bind_row(row, self.file_queue[index])
+            elif row["y"] is not None:
+                row["row_frame"].place_forget()
+                row["y"] = None
+                row["path"] = None
+
+        if content > viewport:
+            self.files_scrollbar.set(
+                self._list_top / content, (self._list_top + viewport) / content
+            )
+        else:
+            self.files_scrollbar.set(0.0, 1.0)
+
+    def _scroll_file_list(self, delta: float):
+        """Scroll the file list.
+
+        Args:
+            delta: Distance to scroll in unscaled units; positive scrolls down.
+        """
+        if delta:
+            self._list_top += delta
+            self._render_file_list()
+
+    def _on_list_scrollbar(self, action: str, amount: Any, unit: str = "units"):
+        """Handle scrollbar commands for the file list.
+
+        Args:
+            action: Either "moveto" or "scroll".
+            amount: Fraction to move to, or number of units to scroll.
+            unit: Scroll unit ("units" or "pages") for the "scroll" action.
+        """
+        if action == "moveto":
+            self._list_top = float(amount) * len(self.file_queue) * LIST_ROW_HEIGHT
+            self._render_file_list()
+        elif action == "scroll":
+            if unit == "pages":
+                step = self.files_list_frame.winfo_height() / self._get_widget_scaling()
+            else:
+                step = LIST_SCROLL_UNIT
+            self._scroll_file_list(float(amount) * step)
+
+    def _on_list_mouse_wheel(self, event: Any):
+        """Scroll the file list with the mouse wheel while hovering it.
+
+        Args:
+            event: Mouse wheel event.
+        """
+        if not str(event.widget).startswith(str(self.files_list_frame)):
+            return
+
+        if sys.platform.startswith("win"):
+            delta = -event.delta / 6
+        elif sys.platform == "darwin":
+            delta = -event.delta * 8
+        else:
+            delta = -LIST_SCROLL_UNIT if event.num == 4 else LIST_SCROLL_UNIT
+        self._scroll_file_list(delta)
 
-    def _add_files_to_queue(self, file_paths: Tuple[str, ...]):
+    def _add_files_to_queue(self, file_paths: Tuple[str, ...], verified: bool = False):
         """Add multiple files to the processing queue.
 
         Args:
             file_paths: Tuple or list of file paths to add.
+            verified: Whether the caller has already checked that every path
+                exists and has a supported extension, so the per-file checks
+                can be skipped.
         """
         output_dir = self.output_entry.get().strip()
+        queued_before = len(self.file_queue)
+
+        kinds: Dict[str, Optional[str]] = {}
+        if not verified:
+            # Look up every new supported path at once, so a large selection
+            # from one folder is answered by a single directory scan rather
+            # than a stat per file
+            kinds = _path_kinds([
+                path for path in file_paths
+                if path not in self.file_index
+                and os.path.splitext(path)[1].lower() in self.supported_extensions
+            ])
 
         for file_path in file_paths:
             # Skip if already in queue
-            if any(f["path"] == file_path for f in self.file_queue):
-                logger.info(f"File already in queue: {file_path}")
+            if file_path in self.file_index:
+                logger.info("File already in queue: %s", file_path)
                 continue
 
-            # Validate file exists
-            if not Path(file_path).exists():
-                logger.warning(f"File does not exist: {file_path}")
-                continue
+            if not verified:
+                # The file dialog also offers "All files"; reject unsupported
+                # types before touching the filesystem
+                ext = os.path.splitext(file_path)[1].lower()
+                if ext not in self.supported_extensions:
+                    logger.info("Skipping unsupported file type: %s", file_path)
+                    continue
+
+                # Validate file exists
+                if kinds.get(file_path) != "file":
+                    logger.warning("File does not exist: %s", file_path)
+                    continue
 
             # Generate output path
             output_filename = self.generate_output_filename(file_path)
             output_path = os.path.join(output_dir, output_filename)
 
+            # Names shown in the list and log dialog, computed once per file
+            basename = os.path.basename(file_path)
+            display_name = basename
+            if len(basename) > MAX_FILENAME_DISPLAY_LENGTH:
+                display_name = basename[: MAX_FILENAME_DISPLAY_LENGTH - 3] + "..."
+
             # Add to queue
             file_info = {
                 "path": file_path,
+                "basename": basename,
+                "display_name": display_name,
                 "status": "pending",
                 "progress": 0.0,
                 "output_path": output_path,
-                "error_log": "",
-                "parser": self._create_progress_parser(),  # Each file has its own progress parser
+                # Bounded, so a noisy file keeps only its most recent lines
+                "error_log": collections.deque(maxlen=MAX_ERROR_LOG_LINES),
+                # Created when the file starts processing and dropped once its
+                # final output has been applied, so only running files hold one
+                "parser": None,
                 "eta": "--:--",
                 "elapsed": "00:00",
                 "speed": "--",
             }
             self.file_queue.append(file_info)
-            logger.info(f"Added file to queue: {file_path}")
+            self.file_index[file_path] = file_info
+            logger.info("Added file to queue: %s", file_path)
+
+        if len(self.file_queue) == queued_before:
+            return
+
+        if queued_before == 0:
+            # First files: swap the placeholder for the list
+            self._refresh_file_list_display()
+        else:
+            # New files go at the end, so rows already on screen keep their
+            # files and only newly visible slots get bound
+            self._render_file_list()
 
-        # Refresh display
-        self._refresh_file_list_display()
+    def _prepare_batch(self):
+        """Prepare per-batch state before any file of the batch is processed.
+
+        Called on the UI thread when a batch starts. Subclasses can override
+        this to compute settings shared by every file in the batch.
+        """
+        pass
 
     def _create_progress_parser(self) -> Any:
         """Create a progress parser instance for a file.
@@ -565,43 +1076,16 @@ class GenericBatchView(BaseView, ABC):
         """
         try:
             files_str = event.data
-            logger.info(f"Drop event received, data: {files_str[:200]}...")
-
-            # Parse the file paths
-            file_paths = []
-            current_path = ""
-            in_braces = False
-
-            i = 0
-            while i < len(files_str):
-                char = files_str[i]
-
-                if char == "{":
-                    in_braces = True
-                    i += 1
-                    continue
-                elif char == "}":
-                    in_braces = False
-                    if current_path:
-                        file_paths.append(current_path)
-                        current_path = ""
-                    i += 1
-                    continue
-                elif char == " " and not in_braces:
-                    if current_path:
-                        file_paths.append(current_path)
-                        current_path = ""
-                    i += 1
-                    continue
-                else:
-                    current_path += char
-                    i += 1
+            logger.info("Drop event received, data: %.200s...", files_str)
 
-            # Add the last path if any
-            if current_path:
-                file_paths.append(current_path)
+            # Drop data is a Tcl list (paths containing spaces are wrapped in
+            # braces), so let Tcl's own parser split it
+            try:
+                file_paths = list(self.tk.splitlist(files_str))
+            except tk.TclError:
+                file_paths = []
 
-            # If no paths found with braces parsing, try splitting by common separators
+            # If the data is not a valid list, try splitting by common separators
             if not file_paths:
                 if ";" in files_str:
                     file_paths = [p.strip() for p in files_str.split(";") if p.strip()]
@@ -614,41 +1098,41 @@ class GenericBatchView(BaseView, ABC):
 
             # Filter to only include files (not directories) and valid extensions
             valid_files: list[str] = []
+            file_paths = [p.strip() for p in file_paths if p.strip()]
+            path_kinds = _path_kinds(file_paths)
 
             for file_path in file_paths:
-                file_path = file_path.strip()
-                if not file_path:
+                kind = path_kinds[file_path]
+                if kind is None:
+                    logger.warning("Dropped path does not exist: %s", file_path)
                     continue
 
-                path_obj = Path(file_path)
-                if not path_obj.exists():
-                    logger.warning(f"Dropped path does not exist: {file_path}")
-                    continue
-
-                if path_obj.is_dir():
-                    # If it's a directory, recursively find all valid files
-                    for ext in self.supported_extensions:
-                        valid_files.extend(str(p) for p in path_obj.rglob(f"*{ext}"))
-                        valid_files.extend(
-                            str(p) for p in path_obj.rglob(f"*{ext.upper()}")
-                        )
-                elif path_obj.is_file():
-                    if path_obj.suffix.lower() in self.supported_extensions:
+                if kind == "dir":
+                    # If it's a directory, recursively find all valid files in
+                    # one walk, matching extensions case-insensitively
+                    for root, _, names in os.walk(file_path):
+                        for name in names:
+                            ext = os.path.splitext(name)[1].lower()
+                            if ext in self.supported_extensions:
+                                valid_files.append(os.path.join(root, name))
+                elif kind == "file":
+                    ext = os.path.splitext(file_path)[1].lower()
+                    if ext in self.supported_extensions:
                         valid_files.append(file_path)
                     else:
-                        logger.info(f"Skipping unsupported file type: {file_path}")
+                        logger.info("Skipping unsupported file type: %s", file_path)
 
             # Add files to queue
             if valid_files:
                 logger.info(f"Adding {len(valid_files)} file(s) from drag and drop")
-                self._add_files_to_queue(tuple(valid_files))
+                # Every path came from a stat or directory listing just now
+                self._add_files_to_queue(tuple(valid_files), verified=True)
             else:
                 logger.info("No valid files found in drop")
                 extensions_str = ", ".join(self.supported_extensions).upper()
-                messagebox.showinfo(
-                    "No Valid Files",
-                    f"No supported files were found in the dropped items.\n\n"
-                    f"Supported formats: {extensions_str}",
+                self._flash_status(
+                    f"No supported files dropped. Supported formats: {extensions_str}",
+                    "warning",
                 )
 
         except Exception as e:
@@ -664,19 +1148,16 @@ class GenericBatchView(BaseView, ABC):
             file_path: Path to the file whose logs should be displayed.
         """
         # Find file info
-        file_info = None
-        for f in self.file_queue:
-            if f["path"] == file_path:
-                file_info = f
-                break
+        file_info = self.file_index.get(file_path)
 
         if not file_info or not file_info.get("error_log"):
-            messagebox.showinfo("No Logs", "No error logs available for this file.")
+            self._flash_status("No error logs available for this file.")
             return
 
         # Display the error log in a separate dialog
-        filename = os.path.basename(file_path)
-        log_text = f"=== Error log for {filename} ===\n\n{file_info['error_log']}\n\n"
+        filename = file_info["basename"]
+        error_log = "".join(file_info["error_log"])
+        log_text = f"=== Error log for {filename} ===\n\n{error_log}\n\n"
 
         dialog = LogDialog(self.app, filename, log_text)
         self.app.wait_window(dialog)
@@ -769,15 +1250,7 @@ class GenericBatchView(BaseView, ABC):
     def _go_to_home(self):
         """Navigate back to the home view, stopping any running processes if needed."""
         # Check if there are any running processes
-        has_running_processes = (
-            self.is_processing
-            or any(
-                proc and proc.poll() is None
-                for proc in self.active_processes.values()
-            )
-        )
-
-        if has_running_processes:
+        if self.is_processing or self.has_running_processes():
             # Warn user and ask for confirmation
             response = messagebox.askyesno(
                 "Stop Processing?",
@@ -799,14 +1272,14 @@ class GenericBatchView(BaseView, ABC):
             time.sleep(0.5)
 
             # Terminate any remaining processes
-            for file_path, proc in list(self.active_processes.items()):
+            for file_path, proc in self._running_processes():
                 if proc and proc.poll() is None:
                     logger.info(f"Terminating remaining process for: {file_path}")
-                    proc.terminate()
+                    _signal_process(proc)
                     try:
                         proc.wait(timeout=2)
                     except subprocess.TimeoutExpired:
-                        proc.kill()
+                        _signal_process(proc, kill=True)
 
         # Navigate to home view
         if hasattr(self.app, "show_view"):
@@ -815,9 +1288,9 @@ class GenericBatchView(BaseView, ABC):
     def _start_processing(self):
         """Start processing all pending/failed files in the queue."""
         if self.is_processing:
-            messagebox.showwarning(
-                "Process Running",
+            self._flash_status(
                 "A process is already running. Please wait for it to complete.",
+                "warning",
             )
             return
 
@@ -845,15 +1318,14 @@ class GenericBatchView(BaseView, ABC):
             f for f in self.file_queue if f["status"] in ("pending", "failed")
         ]
         if not files_to_process:
-            messagebox.showinfo(
-                "Nothing to Process",
-                "All files have been processed successfully. Add new files or clear successful files to process again.",
+            self._flash_status(
+                "All files have been processed. Add new files to process again."
             )
             return
 
         # Update UI state
         self.is_processing = True
-        self.stop_requested = False
+        self._batch_stop = threading.Event()
         self.start_stop_btn.configure(
             text="Stop",
             command=self._stop_processing,
@@ -863,46 +1335,86 @@ class GenericBatchView(BaseView, ABC):
         )
 
         logger.info(f"Starting batch processing of {len(files_to_process)} file(s)")
+        self._prepare_batch()
 
         # Start processing thread
-        process_thread = threading.Thread(target=self._process_queue, daemon=True)
+        process_thread = threading.Thread(
+            target=self._process_queue, args=(self._batch_stop,), daemon=True
+        )
         process_thread.start()
+        self._start_output_polling()
+
+    def _start_output_polling(self):
+        """Start polling for process output unless it is already running."""
+        if not self._polling:
+            self._polling = True
+            self._poll_interval_ms = PROGRESS_CHECK_INTERVAL_MS
+            self._check_process_output()
+
+    def _stop_processing(
+        self, wait: bool = True
+    ) -> List[Tuple[str, subprocess.Popen]]:
+        """Stop all current processing and mark files as failed.
+
+        Args:
+            wait: Whether to block until each terminated subprocess exits. Pass
+                False when the caller watches for exit itself.
 
-    def _stop_processing(self):
-        """Stop all current processing and mark files as failed."""
+        Returns:
+            (file_path, process) tuples that were signalled to stop. The batch
+            forgets its processes once it finishes, so a caller that does not
+            wait must keep this list to reap them.
+        """
         if not self.is_processing:
-            return
+            return []
 
         logger.info("Stop requested by user")
-        self.stop_requested = True
+        self._batch_stop.set()
 
-        # Terminate all active subprocesses
-        for file_path, proc in list(self.active_processes.items()):
+        # Terminate all active subprocesses first, so they shut down in parallel
+        terminated: List[Tuple[str, subprocess.Popen]] = []
+        for file_path, proc in self._running_processes():
             if proc and proc.poll() is None:
                 logger.info(f"Terminating subprocess for: {file_path}")
-                proc.terminate()
-                try:
-                    proc.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    logger.warning(f"Process did not terminate, killing: {file_path}")
-                    proc.kill()
+                _signal_process(proc)
+                terminated.append((file_path, proc))
 
                 # Mark file as failed
-                for file_info in self.file_queue:
-                    if file_info["path"] == file_path:
-                        file_info["status"] = "failed"
-                        file_info["error_log"] = "Processing stopped by user"
-                        file_info["progress"] = 0.0
-                        self.output_queue.put(("file_update", file_path))
-                        break
+                file_info = self.file_index.get(file_path)
+                if file_info:
+                    file_info["status"] = "failed"
+                    file_info["error_log"].clear()
+                    file_info["error_log"].append("Processing stopped by user")
+                    file_info["progress"] = 0.0
+                    self._post_output(("file_update", file_path))
+
+        # Then wait for all of them against one shared deadline
+        if wait:
+            _reap_processes(terminated, PROCESS_STOP_TIMEOUT_S)
 
         # Update UI state
         self.start_stop_btn.configure(state="disabled")
+        return terminated
+
+    def request_stop(self) -> List[Tuple[str, subprocess.Popen]]:
+        """Stop processing without waiting for the subprocesses to exit.
+
+        Used when the application closes, which watches for the exits from
+        the event loop instead of blocking it.
 
-    def _process_queue(self):
-        """Process files from the queue with concurrent batch processing."""
+        Returns:
+            (file_path, process) tuples that were signalled to stop.
+        """
+        return self._stop_processing(wait=False)
+
+    def _process_queue(self, stop: threading.Event):
+        """Process files from the queue with concurrent batch processing.
+
+        Args:
+            stop: This batch's stop signal.
+        """
         try:
-            batch_size = self.app.config.get("batch_size", 1)
+            batch_size = _worker_count(self.app.config.get("batch_size", 1))
             logger.info(f"Starting batch processing with batch size: {batch_size}")
 
             # Get list of files to process
@@ -910,54 +1422,112 @@ class GenericBatchView(BaseView, ABC):
                 f for f in self.file_queue if f["status"] in ("pending", "failed")
             ]
 
-            # Track active processing threads
-            active_threads: dict[str, threading.Thread] = {}
-
-            # Process files
-            while not self.stop_requested and (files_to_process or active_threads):
-                # Start new processes up to batch_size
-                while (
-                    len(active_threads) < batch_size
-                    and files_to_process
-                    and not self.stop_requested
-                ):
-                    file_info = files_to_process.pop(0)
-                    file_path = file_info["path"]
-
-                    # Start processing thread for this file
-                    thread = threading.Thread(
-                        target=self._process_file, args=(file_info,), daemon=True
-                    )
-                    active_threads[file_path] = thread
-                    self.currently_processing.add(file_path)
-                    thread.start()
-                    logger.info(f"Started processing: {file_path}")
-
-                # Check for completed threads
-                for file_path in list(active_threads.keys()):
-                    thread = active_threads[file_path]
-                    if not thread.is_alive():
-                        # Thread finished
-                        del active_threads[file_path]
-                        if file_path in self.currently_processing:
-                            self.currently_processing.remove(file_path)
-                        logger.info(f"Finished processing: {file_path}")
-
-                # Small delay to avoid busy waiting
-                threading.Event().wait(0.1)
-
-            # Wait for remaining threads to complete
-            for thread in active_threads.values():
-                thread.join(timeout=1)
+            # A fixed set of batch_size workers takes files from a shared queue,
+            # so threads are reused across files rather than started per file
+            work: queue.SimpleQueue = queue.SimpleQueue()
+            for file_info in files_to_process:
+                work.put(file_info)
+
+            workers = [
+                threading.Thread(
+                    target=self._batch_worker,
+                    args=(work, stop),
+                    name=f"batch-worker-{i}",
+                    daemon=True,
+                )
+                for i in range(min(batch_size, len(files_to_process)))
+            ]
+            for worker in workers:
+                worker.start()
+
+            # Also after a stop, wait until every worker has returned from its
+            # current file, so the view only goes idle once nothing runs
+            for worker in workers:
+                worker.join()
 
             # Queue completion message
-            self.output_queue.put(("batch_done", None))
+            self._post_output(("batch_done", None))
 
         except Exception as e:
             logger.error(f"Error in queue processing: {e}")
-            self.output_queue.put(("batch_error", str(e)))
-        finally:
-            self.currently_processing.clear()
+            self._post_output(("batch_error", str(e)))
+
+    def _batch_worker(
+        self,
+        work: queue.SimpleQueue,
+        stop: threading.Event,
+    ):
+        """Process files from the batch queue until it is empty or stopped.
+
+        Args:
+            work: Queue of file info dictionaries still to be processed.
+            stop: The stop signal of the batch this worker belongs to.
+        """
+        while not stop.is_set():
+            try:
+                file_info = work.get_nowait()
+            except queue.Empty:
+                return
+
+            file_path = file_info["path"]
+            with self._state_lock:
+                self.active[file_path] = ProcessSlot(file_info, None)
+            logger.info(f"Started processing: {file_path}")
+            try:
+                self._process_file(file_info)
+            finally:
+                with self._state_lock:
+                    self.active.pop(file_path, None)
+                logger.info(f"Finished processing: {file_path}")
+
+    def has_running_processes(self) -> bool:
+        """Check whether any subprocess started by this view is still alive.
+
+        Returns:
+            True if at least one subprocess has not exited yet.
+        """
+        return any(
+            proc and proc.poll() is None for _, proc in self._running_processes()
+        )
+
+    def kill_processes(self, processes: List[Tuple[str, subprocess.Popen]]) -> None:
+        """Kill each of the given subprocesses that is still alive, without waiting.
+
+        Args:
+            processes: (file_path, process) tuples, as returned by request_stop.
+        """
+        for file_path, proc in processes:
+            if proc.poll() is None:
+                logger.warning("Killing process that did not exit for: %s", file_path)
+                _signal_process(proc, kill=True)
+
+    def _track_process(self, file_path: str, proc: subprocess.Popen) -> None:
+        """Record the subprocess started for a file, so it can be stopped.
+
+        Called by `_process_file` implementations from the worker thread.
+
+        Args:
+            file_path: Path of the file being processed.
+            proc: The subprocess processing it.
+        """
+        with self._state_lock:
+            slot = self.active.get(file_path)
+            if slot is not None:
+                slot.proc = proc
+
+    def _running_processes(self) -> List[Tuple[str, subprocess.Popen]]:
+        """Get a snapshot of the active subprocesses.
+
+        Returns:
+            List of (file_path, process) tuples safe to iterate while worker
+            threads add and remove processes.
+        """
+        with self._state_lock:
+            return [
+                (file_path, slot.proc)
+                for file_path, slot in self.active.items()
+                if slot.proc is not None
+            ]
 
     @abstractmethod
     def _process_file(self, file_info: Dict[str, Any]):
@@ -972,36 +1542,199 @@ class GenericBatchView(BaseView, ABC):
                 - status: Current status (will be "processing" when called)
                 - progress: Current progress (0.0 to 1.0)
                 - parser: Progress parser instance
-                - error_log: Error log string
+                - error_log: Deque of error log text, joined for display
         """
         pass
 
-    def _read_stream(self, stream, stream_type: str, file_path: str):
-        """Read from a stream (stdout or stderr) and queue output.
+    def _post_output(self, message: Tuple):
+        """Queue a message for the UI thread.
+
+        Safe to call from any thread; messages are handled in order by
+        `_check_process_output`.
+
+        Args:
+            message: Tuple containing (message_type, *args).
+        """
+        with self._output_lock:
+            self._output_buffer.append(message)
+            self._output_event.set()
+
+    def _watch_process_output(
+        self, proc: subprocess.Popen, file_path: str
+    ) -> threading.Event:
+        """Start forwarding a process's stdout and stderr to the UI thread.
+
+        Args:
+            proc: The running subprocess, opened with binary pipes.
+            file_path: Path of the file being processed.
+
+        Returns:
+            Event that is set once both streams have been read to EOF.
+        """
+        assert proc.stdout is not None and proc.stderr is not None
+        watch = StreamWatch(2, threading.Event())
+        streams = ((proc.stdout, "stdout"), (proc.stderr, "stderr"))
+        with self._reader_lock:
+            self._open_streams += 2
+
+        if sys.platform == "win32":
+            for stream, stream_type in streams:
+                threading.Thread(
+                    target=self._read_stream,
+                    args=(stream, stream_type, file_path, watch),
+                    daemon=True,
+                ).start()
+            return watch.done
+
+        with self._reader_lock:
+            if self._stream_selector is None:
+                self._stream_selector = selectors.DefaultSelector()
+            for stream, stream_type in streams:
+                # A spurious wakeup must never park the shared reader in read()
+                os.set_blocking(stream.fileno(), False)
+                self._stream_selector.register(
+                    stream,
+                    selectors.EVENT_READ,
+                    (stream_type, file_path, bytearray(), watch),
+                )
+            if self._reader_thread is None:
+                self._reader_thread = threading.Thread(
+                    target=self._run_stream_reader, daemon=True
+                )
+                self._reader_thread.start()
+
+        return watch.done
+
+    def _run_stream_reader(self):
+        """Read all registered subprocess pipes from a single thread.
+
+        Exits once no streams are left; `_watch_process_output` starts a new
+        reader when the next process is launched.
+        """
+        selector = self._stream_selector
+        assert selector is not None
+        post = self._post_output
+        marker = self._progress_marker_bytes()
+
+        while True:
+            with self._reader_lock:
+                if not selector.get_map():
+                    self._reader_thread = None
+                    return
+
+            for key, _ in selector.select(timeout=0.1):
+                stream_type, file_path, buf, watch = key.data
+                try:
+                    chunk = os.read(key.fd, STREAM_READ_SIZE)
+                except BlockingIOError:
+                    continue
+                except OSError as e:
+                    logger.error("Error reading %s: %s", stream_type, e)
+                    chunk = b""
+
+                if chunk:
+                    buf += chunk
+                    lines = _pop_lines(buf, marker)
+                    if lines:
+                        post((stream_type, lines, file_path))
+                else:
+                    with self._reader_lock:
+                        selector.unregister(key.fileobj)
+                    self._finish_stream(key.fileobj, stream_type, file_path, buf, watch)
+
+    def _read_stream(
+        self, stream, stream_type: str, file_path: str, watch: StreamWatch
+    ):
+        """Read from a binary stream (stdout or stderr) and queue output.
+
+        Used on platforms where pipes cannot be multiplexed with selectors.
 
         Args:
             stream: The stream to read from.
             stream_type: Type of stream ('stdout' or 'stderr').
             file_path: Path of the file being processed.
+            watch: Shared EOF bookkeeping for the process' streams.
         """
+        buf = bytearray()
+        marker = self._progress_marker_bytes()
         try:
-            for line in iter(stream.readline, ""):
-                if line:
-                    self.output_queue.put((stream_type, line, file_path))
+            fd = stream.fileno()
+            while True:
+                chunk = os.read(fd, STREAM_READ_SIZE)
+                if not chunk:
+                    break
+                buf += chunk
+                lines = _pop_lines(buf, marker)
+                if lines:
+                    self._post_output((stream_type, lines, file_path))
         except Exception as e:
             logger.error(f"Error reading {stream_type}: {e}")
         finally:
-            stream.close()
+            self._finish_stream(stream, stream_type, file_path, buf, watch)
+
+    def _progress_marker_bytes(self) -> Optional[bytes]:
+        """Get the progress marker in the form the stream readers match on.
+
+        Returns:
+            The encoded `progress_marker`, or None if every line is kept.
+        """
+        if self.progress_marker is None:
+            return None
+        return self.progress_marker.encode()
+
+    def _finish_stream(
+        self,
+        stream,
+        stream_type: str,
+        file_path: str,
+        buf: bytearray,
+        watch: StreamWatch,
+    ):
+        """Flush a stream's last partial line, close it and record EOF.
 
-    def _handle_stream_message(self, line: str, file_path: str):
+        Args:
+            stream: The stream that reached EOF.
+            stream_type: Type of stream ('stdout' or 'stderr').
+            file_path: Path of the file being processed.
+            buf: Bytes read from the stream but not yet queued.
+            watch: Shared EOF bookkeeping for the process' streams.
+        """
+        # Flush a final line that was not newline-terminated
+        if buf:
+            buf += b"\n"
+            lines = _pop_lines(buf, self._progress_marker_bytes())
+            if lines:
+                self._post_output((stream_type, lines, file_path))
+        stream.close()
+
+        with self._reader_lock:
+            self._open_streams -= 1
+            watch.open_streams -= 1
+            if watch.open_streams == 0:
+                watch.done.set()
+
+    def _handle_stream_message(
+        self, stream_type: str, lines: List[str], file_path: str
+    ):
         """Handle stdout/stderr message from subprocess.
 
         Args:
-            line: Output line from subprocess.
+            stream_type: Type of stream ('stdout' or 'stderr').
+            lines: Output lines from one read of the subprocess pipe.
             file_path: Path to the file being processed.
         """
-        self._update_file_progress(line, file_path)
-        self._append_to_file_log(file_path, line)
+        if stream_type in self.progress_streams:
+            # Lines without the progress marker never reach the parser
+            marker = self.progress_marker
+            progress_lines = (
+                lines if marker is None else [line for line in lines if marker in line]
+            )
+            if progress_lines:
+                self._pending_progress.setdefault(file_path, []).extend(
+                    progress_lines
+                )
+        for line in lines:
+            self._append_to_file_log(file_path, line)
 
     def _handle_queue_message(self, message: Tuple):
         """Handle a single message from the output queue.
@@ -1012,11 +1745,14 @@ class GenericBatchView(BaseView, ABC):
         msg_type = message[0]
 
         if msg_type in ("stdout", "stderr"):
-            _, line, file_path = message
-            self._handle_stream_message(line, file_path)
+            _, lines, file_path = message
+            self._handle_stream_message(msg_type, lines, file_path)
         elif msg_type == "file_update":
             file_path = message[1]
-            self._update_file_row(file_path)
+            self._dirty_rows.add(file_path)
+            file_info = self.file_index.get(file_path)
+            if file_info and file_info["status"] in ("success", "failed"):
+                self._finished_files.add(file_path)
         elif msg_type == "batch_done":
             logger.info("Batch processing completed")
             self._finalize_batch_processing()
@@ -1026,33 +1762,111 @@ class GenericBatchView(BaseView, ABC):
             self._finalize_batch_processing()
 
     def _check_process_output(self):
-        """Periodically check for process output from queue and update UI."""
-        try:
-            while True:
-                try:
-                    message = self.output_queue.get_nowait()
-                    self._handle_queue_message(message)
-                except queue.Empty:
-                    break
-        except Exception as e:
-            logger.error(f"Error processing output queue: {e}")
-            self._finalize_batch_processing()
+        """Periodically check for process output from queue and update UI.
+
+        Reschedules itself while a batch is running, a subprocess stream is
+        still open or output is pending; `_start_output_polling` re-arms it
+        for the next batch. The interval doubles on every poll that finds no
+        output, up to IDLE_CHECK_INTERVAL_MS, and drops back as soon as output
+        arrives.
+        """
+        if self._output_event.is_set():
+            self._poll_interval_ms = PROGRESS_CHECK_INTERVAL_MS
+
+            # Take everything queued since the last poll in one lock round-trip,
+            # then handle the batch without holding the lock
+            with self._output_lock:
+                batch = self._output_buffer
+                self._output_buffer = collections.deque()
+                self._output_event.clear()
+
+            # Bound methods hoisted out of the loop; stream output is by far
+            # the most common message, so it skips the generic dispatch
+            handle_stream = self._handle_stream_message
+            handle_message = self._handle_queue_message
+            deadline = time.monotonic() + OUTPUT_DRAIN_BUDGET_S
+            handled = 0
+            try:
+                while batch:
+                    message = batch.popleft()
+                    if message[0] in ("stdout", "stderr"):
+                        handle_stream(*message)
+                    else:
+                        handle_message(message)
+                    handled += 1
+                    if (
+                        handled % OUTPUT_BUDGET_CHECK_EVERY == 0
+                        and time.monotonic() > deadline
+                    ):
+                        break
 
-        self.after(PROGRESS_CHECK_INTERVAL_MS, self._check_process_output)
+                if batch:
+                    # Over budget: hand the rest back, ahead of newer output,
+                    # so the UI stays responsive during a burst
+                    with self._output_lock:
+                        batch.extend(self._output_buffer)
+                        self._output_buffer = batch
+                        self._output_event.set()
+
+                self._flush_file_logs()
+                self._flush_progress()
+                self._release_parsers()
+                self._flush_dirty_rows()
+            except Exception as e:
+                logger.error(f"Error processing output queue: {e}")
+                self._finalize_batch_processing()
+        else:
+            self._poll_interval_ms = min(
+                self._poll_interval_ms * 2, IDLE_CHECK_INTERVAL_MS
+            )
+
+        # Open streams are checked before the event: a stream's last lines are
+        # posted before it is counted as closed, so they cannot slip between
+        if (
+            self.is_processing
+            or self._open_streams
+            or self._output_event.is_set()
+        ):
+            self.after(self._poll_interval_ms, self._check_process_output)
+        else:
+            self._polling = False
 
-    def _update_file_progress(self, line: str, file_path: str):
-        """Update progress bar for a specific file from a line of output.
+    def _flush_progress(self):
+        """Update file progress from the output collected during the current poll."""
+        if not self._pending_progress:
+            return
+
+        pending = self._pending_progress
+        self._pending_progress = {}
+        for file_path, lines in pending.items():
+            self._update_file_progress(lines, file_path)
+
+    def _release_parsers(self):
+        """Drop the progress parsers of files that finished during this poll.
+
+        The final update of a file is posted after its last output, so by now
+        that output has been parsed.
+        """
+        if not self._finished_files:
+            return
+
+        for file_path in self._finished_files:
+            file_info = self.file_index.get(file_path)
+            # The file may have been queued for another run since
+            if file_info and file_info["status"] in ("success", "failed"):
+                file_info["parser"] = None
+        self._finished_files.clear()
+
+    def _update_file_progress(self, lines: List[str], file_path: str):
+        """Update progress bar for a specific file from its latest output.
 
         Args:
-            line: A line of output that may contain progress information.
+            lines: Lines of output, oldest first, that may contain progress
+                information.
             file_path: Path to the file being processed.
         """
         # Find the file info
-        file_info = None
-        for f in self.file_queue:
-            if f["path"] == file_path:
-                file_info = f
-                break
+        file_info = self.file_index.get(file_path)
 
         if not file_info:
             return
@@ -1062,7 +1876,7 @@ class GenericBatchView(BaseView, ABC):
         if not parser:
             return
 
-        if parser.parse(line):
+        if parser.feed(lines):
             # Update file progress
             progress_fraction = parser.get_progress_fraction()
             file_info["progress"] = progress_fraction
@@ -1072,31 +1886,57 @@ class GenericBatchView(BaseView, ABC):
             file_info["elapsed"] = parser.format_elapsed()
             file_info["speed"] = parser.format_rate()
 
-            # Queue update for UI thread
-            self.output_queue.put(("file_update", file_path))
+            # Redraw the row once this poll's output has been handled
+            self._dirty_rows.add(file_path)
+
+    def _flush_dirty_rows(self):
+        """Redraw every row that changed while handling the current poll."""
+        if not self._dirty_rows:
+            return
+
+        dirty_rows = self._dirty_rows
+        self._dirty_rows = set()
+        for file_path in dirty_rows:
+            self._update_file_row(file_path)
 
     def _append_to_file_log(self, file_path: str, line: str):
-        """Append a line to the error log for a file.
+        """Collect a line for the error log of a file.
+
+        Lines are buffered and written by _flush_file_logs once per poll, so a
+        noisy subprocess costs one log extend per file per poll rather than
+        one per line.
 
         Args:
             file_path: Path to the file.
             line: Line to append to the log.
         """
-        # Find the file info
-        for file_info in self.file_queue:
-            if file_info["path"] == file_path:
-                # Only append if it looks like an error or warning
-                line_lower = line.lower()
-                if any(keyword in line_lower for keyword in ERROR_KEYWORDS):
-                    file_info["error_log"] += line
-                break
+        # Only keep lines that look like an error or warning
+        if ERROR_PATTERN.search(line.lower()):
+            self._pending_log_lines.setdefault(file_path, []).append(line)
+
+    def _flush_file_logs(self):
+        """Append buffered error-log lines to their files' logs.
+
+        Each log keeps at most MAX_ERROR_LOG_LINES entries; the oldest are
+        dropped once a log grows past it.
+        """
+        if not self._pending_log_lines:
+            return
+
+        pending = self._pending_log_lines
+        self._pending_log_lines = {}
+
+        for file_path, lines in pending.items():
+            file_info = self.file_index.get(file_path)
+            if not file_info or not lines:
+                continue
+            file_info["error_log"].extend(lines)
 
     def _finalize_batch_processing(self):
         """Finalize batch processing and update UI state."""
         self.is_processing = False
-        self.stop_requested = False
-        self.currently_processing.clear()
-        self.active_processes.clear()
+        with self._state_lock:
+            self.active.clear()
 
         # Update UI buttons
         self.start_stop_btn.configure(
@@ -1141,11 +1981,12 @@ class GenericBatchView(BaseView, ABC):
         if self.is_processing:
             self._stop_processing()
 
-        # Terminate any remaining processes
-        for file_path, proc in list(self.active_processes.items()):
-            if proc and proc.poll() is None:
-                proc.terminate()
-                try:
-                    proc.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    proc.kill()
+        # Terminate any remaining processes, then wait for them together
+        remaining = [
+            (file_path, proc)
+            for file_path, proc in self._running_processes()
+            if proc and proc.poll() is None
+        ]
+        for _, proc in remaining:
+            _signal_process(proc)
+        _reap_processes(remaining, CLEANUP_STOP_TIMEOUT_S)
@@ -3,6 +3,7 @@
 The home view is the default view that is shown when the application is launched.
 """
 
+import functools
 import logging
 import sys
 import tkinter.messagebox as messagebox
@@ -16,10 +17,12 @@ from views.base_view import BaseView
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path: str) -> str:
     """Get the absolute path to a resource file.
 
-    Works both in development and when bundled with PyInstaller.
+    Works both in development and when bundled with PyInstaller. The bundle
+    location is fixed for the life of the process, so results are cached.
 
     Args:
         relative_path: Relative path to the resource file.
@@ -99,20 +102,24 @@ class HomeView(BaseView):
         # Three task buttons in a row - square and fixed size
         button_size = 150  # Square buttons (width = height)
 
-        # Load icons from flaticon for buttons
+        # Load icons from flaticon for buttons; the white icons serve both
+        # appearance modes, so each file is decoded once
+        deface_image = Image.open(get_resource_path("flaticons/png/002-blind-white.png"))
         deface_icon = ctk.CTkImage(
-            light_image=Image.open(get_resource_path("flaticons/png/002-blind-white.png")),
-            dark_image=Image.open(get_resource_path("flaticons/png/002-blind-white.png")),
+            light_image=deface_image,
+            dark_image=deface_image,
             size=(60, 60)
         )
+        smudge_image = Image.open(get_resource_path("flaticons/png/001-paint-brush-white.png"))
         smudge_icon = ctk.CTkImage(
-            light_image=Image.open(get_resource_path("flaticons/png/001-paint-brush-white.png")),
-            dark_image=Image.open(get_resource_path("flaticons/png/001-paint-brush-white.png")),
+            light_image=smudge_image,
+            dark_image=smudge_image,
             size=(60, 60)
         )
+        transcribe_image = Image.open(get_resource_path("flaticons/png/007-speech-to-text-white.png"))
         transcribe_icon = ctk.CTkImage(
-            light_image=Image.open(get_resource_path("flaticons/png/007-speech-to-text-white.png")),
-            dark_image=Image.open(get_resource_path("flaticons/png/007-speech-to-text-white.png")),
+            light_image=transcribe_image,
+            dark_image=transcribe_image,
             size=(60, 60)
         )
 
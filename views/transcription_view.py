@@ -308,9 +308,9 @@ class TranscriptionView(GenericBatchView):
         # Update status to processing
         file_info["status"] = "processing"
         file_info["progress"] = 0.0
-        file_info["error_log"] = ""
+        file_info["error_log"].clear()
         file_info["parser"] = self._create_progress_parser()
-        self.output_queue.put(("file_update", file_path))
+        self._post_output(("file_update", file_path))
 
         try:
             import whisperx
@@ -328,7 +328,7 @@ class TranscriptionView(GenericBatchView):
 
             # Update progress: Loading model (10%)
             file_info["progress"] = 0.1
-            self.output_queue.put(("file_update", file_path))
+            self._post_output(("file_update", file_path))
             logger.info("Loading WhisperX model...")
             logger.info("NOTE: This may take several minutes the first time as the model needs to be downloaded from Hugging Face (several GB). Please be patient...")
 
@@ -390,7 +390,7 @@ class TranscriptionView(GenericBatchView):
 
             # Update progress: Loading audio (20%)
             file_info["progress"] = 0.2
-            self.output_queue.put(("file_update", file_path))
+            self._post_output(("file_update", file_path))
             logger.info("Loading audio file...")
 
             # Set up ffmpeg path before loading audio
@@ -401,7 +401,7 @@ class TranscriptionView(GenericBatchView):
 
             # Update progress: Transcribing (30%)
             file_info["progress"] = 0.3
-            self.output_queue.put(("file_update", file_path))
+            self._post_output(("file_update", file_path))
             logger.info("Transcribing audio...")
 
             # Transcribe
@@ -412,7 +412,7 @@ class TranscriptionView(GenericBatchView):
 
             # Update progress: Aligning (50%)
             file_info["progress"] = 0.5
-            self.output_queue.put(("file_update", file_path))
+            self._post_output(("file_update", file_path))
             logger.info("Aligning timestamps...")
 
             # Align timestamps
@@ -423,7 +423,7 @@ class TranscriptionView(GenericBatchView):
 
             # Update progress: Diarizing (70%)
             file_info["progress"] = 0.7
-            self.output_queue.put(("file_update", file_path))
+            self._post_output(("file_update", file_path))
             logger.info("Performing speaker diarization...")
 
 
@@ -441,7 +441,7 @@ class TranscriptionView(GenericBatchView):
 
             # Update progress: Assigning speakers (85%)
             file_info["progress"] = 0.85
-            self.output_queue.put(("file_update", file_path))
+            self._post_output(("file_update", file_path))
             logger.info("Assigning speakers to segments...")
 
             # Assign speakers to segments
@@ -453,7 +453,7 @@ class TranscriptionView(GenericBatchView):
 
             # Update progress: Writing output (95%)
             file_info["progress"] = 0.95
-            self.output_queue.put(("file_update", file_path))
+            self._post_output(("file_update", file_path))
             logger.info("Writing output file...")
 
             # Write output file
@@ -475,7 +475,7 @@ class TranscriptionView(GenericBatchView):
             file_info["progress"] = 1.0
             file_info["status"] = "success"
             logger.info(f"Successfully processed: {file_path}")
-            self.output_queue.put(("file_update", file_path))
+            self._post_output(("file_update", file_path))
 
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {e}", exc_info=True)
@@ -483,10 +483,8 @@ class TranscriptionView(GenericBatchView):
             file_info["progress"] = 0.0
             # Include full stack trace in error log
             error_trace = traceback.format_exc()
-            file_info["error_log"] += f"\nException: {str(e)}\n\nFull traceback:\n{error_trace}"
-            self.output_queue.put(("file_update", file_path))
-            if file_path in self.currently_processing:
-                self.currently_processing.remove(file_path)
+            file_info["error_log"].append(f"\nException: {str(e)}\n\nFull traceback:\n{error_trace}")
+            self._post_output(("file_update", file_path))
 
     def _write_transcription_output(self, result: Dict, output_path: str, input_path: str):
         """Write transcription results to output file.